@@ -961,7 +961,8 @@ async def api_story_summary_stream(request: Request, project_dir: ProjectDep) ->
 
     async def _handler(payload: dict) -> Any:
         """Helper for the requested value.."""
-        prepared = prepare_chapter_summary_generation(
+        prepared = await asyncio.to_thread(
+            prepare_chapter_summary_generation,
             payload,
             payload.get("chap_id"),
             payload.get("mode") or "",
@@ -1022,7 +1023,8 @@ async def api_story_continue_stream(request: Request, project_dir: ProjectDep) -
 
     async def _handler(payload: dict) -> Any:
         """Helper for the requested value.."""
-        prepared = prepare_continue_chapter_generation(
+        prepared = await asyncio.to_thread(
+            prepare_continue_chapter_generation,
             payload,
             payload.get("chap_id"),
             active=project_dir,
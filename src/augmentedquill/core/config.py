@@ -24,7 +24,9 @@ import json
 import logging
 import os
 import re
+import stat
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional
 
@@ -136,6 +138,8 @@ def _interpolate_env(value: Any) -> Any:
     Non-string types are returned unchanged.
     """
     if isinstance(value, str):
+        if "${" not in value:
+            return value
         return _ENV_PATTERN.sub(
             lambda match: os.getenv(match.group(1), match.group(0)), value
         )
@@ -169,16 +173,26 @@ def load_json_file(path: os.PathLike[str] | str | None) -> Dict[str, Any]:
     if path is None:
         return {}
     p = Path(path)
-    if not p.exists():
+    try:
+        # json.loads decodes UTF-8 bytes itself, skipping the text-layer copy.
+        raw = p.read_bytes()
+    except FileNotFoundError:
         return {}
     try:
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(raw)
         return data if isinstance(data, dict) else {}
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON at {p}: {e}") from e
 
 
+_OPENAI_ENV_VARS = (
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "OPENAI_MODEL",
+    "OPENAI_TIMEOUT_S",
+)
+
+
 def _env_overrides_for_openai() -> Dict[str, Any]:
     """Collect OPENAI_* environment variables into a nested dict structure.
 
@@ -211,6 +225,20 @@ def _env_overrides_for_openai() -> Dict[str, Any]:
     return result
 
 
+def machine_config_env_vars(path: os.PathLike[str] | str) -> tuple[str, ...]:
+    """Return the environment variables ``load_machine_config(path)`` depends on.
+
+    These are the OPENAI_* overrides plus every ``${VAR}`` referenced in the
+    file, so callers caching the loaded config can tell when it went stale.
+    """
+    names = set(_OPENAI_ENV_VARS)
+    try:
+        names.update(_ENV_PATTERN.findall(Path(path).read_text(encoding="utf-8")))
+    except (OSError, UnicodeDecodeError):
+        pass
+    return tuple(sorted(names))
+
+
 def load_machine_config(
     path: os.PathLike[str] | str | None = None,
     defaults: Optional[Mapping[str, Any]] = None,
@@ -251,6 +279,17 @@ def load_story_config(
     )
 
 
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: changing the umask is process-wide and not thread-safe.
+_UMASK = _read_umask()
+
+
 def save_story_config(path: os.PathLike[str] | str, config: Dict[str, Any]) -> None:
     """Save Story Config."""
     p = Path(path)
@@ -258,9 +297,30 @@ def save_story_config(path: os.PathLike[str] | str, config: Dict[str, Any]) -> N
         p.parent.mkdir(parents=True)
 
     clean_config = clean_story_config_for_disk(config)
-
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(clean_config, f, indent=2, ensure_ascii=False)
+    text = json.dumps(clean_config, indent=2, ensure_ascii=False)
+
+    # Serialize fully before touching the file, then swap it in atomically so a
+    # crash or a failed encode never leaves a truncated story.json behind. Each
+    # save gets its own temp file because saves of one project can overlap in
+    # worker threads.
+    fd, tmp_name = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(text.encode("utf-8"))
+            fh.flush()
+            os.fsync(fh.fileno())
+        # mkstemp creates the file as 0600; keep the mode the file had (or would
+        # get from a plain write) so the replace does not change permissions.
+        try:
+            mode = stat.S_IMODE(p.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, p)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def load_model_presets_config(
@@ -13,6 +13,7 @@ This module contains all system messages and user prompt templates used througho
 Prompts can be overridden on a per-model basis through the settings or per-project.
 """
 
+import functools
 import json
 from typing import Dict, Any, Optional
 
@@ -125,6 +126,75 @@ DEFAULT_PROMPTS = _PROMPTS
 # not keep any separate structure here, keeping the data model minimal.
 
 
+def _build_template_index(prompts: Dict[str, Any]) -> Dict[tuple[str, str], str]:
+    """Flatten ``{key: {lang: text}}`` into ``{(key, lang): text}``.
+
+    The English text doubles as the fallback for every language listed in
+    ``_AVAILABLE_LANGUAGES``, so a lookup never needs a second probe.
+    """
+    index: Dict[tuple[str, str], str] = {}
+    for key, entry in prompts.items():
+        if not isinstance(entry, dict):
+            index[(key, "en")] = ensure_string(entry)
+            continue
+        fallback = ensure_string(entry.get("en") or "")
+        for lang in {*_AVAILABLE_LANGUAGES, *entry.keys(), "en"}:
+            index[(key, lang)] = ensure_string(entry.get(lang) or fallback)
+    return index
+
+
+_TEMPLATE_INDEX = _build_template_index(DEFAULT_PROMPTS)
+
+
+def _resolve_template(
+    prompt_type: str,
+    overrides: Optional[Dict[str, Any]],
+    language: str | None,
+) -> str:
+    """Return the raw template, preferring overrides over language defaults."""
+    if overrides and prompt_type in overrides:
+        return ensure_string(overrides[prompt_type])
+    lang = (language or "en").lower()
+    template = _TEMPLATE_INDEX.get((prompt_type, lang))
+    if template is None:
+        template = _TEMPLATE_INDEX.get((prompt_type, "en"), "")
+    return template
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_template(template: str) -> tuple[str, bool]:
+    """Return the brace-escaped form of ``template`` and whether it had escapes.
+
+    Templates come from a small fixed set (defaults plus model overrides), so
+    the escaping pass is done once per distinct template instead of per call.
+    """
+    # Use double braces to prevent .format() from interpreting them
+    safe_template = template.replace("{{", "DOUBLE_OPEN_BRACE").replace(
+        "}}", "DOUBLE_CLOSE_BRACE"
+    )
+    return safe_template, safe_template != template
+
+
+def _format_template(template: str, format_kwargs: Dict[str, Any]) -> str:
+    """Format ``template`` while keeping literal ``{{``/``}}`` intact.
+
+    Missing placeholders or malformed templates return the raw template so
+    newly added JSON placeholders never crash older callsites.
+    """
+    if not template or not format_kwargs:
+        return template
+    try:
+        safe_template, has_escapes = _compile_template(template)
+        formatted = safe_template.format(**format_kwargs)
+        if not has_escapes:
+            return formatted
+        return formatted.replace("DOUBLE_OPEN_BRACE", "{").replace(
+            "DOUBLE_CLOSE_BRACE", "}"
+        )
+    except Exception:
+        return template
+
+
 def get_system_message(
     message_type: str,
     model_overrides: Optional[Dict[str, Any]] = None,
@@ -151,45 +221,10 @@ def get_system_message(
         The system message string
     """
     # both system and user prompts live in the same map; for system messages
-    # we simply pull the raw template and ignore any kwargs.
-    if model_overrides and message_type in model_overrides:
-        template = ensure_string(model_overrides[message_type])
-    else:
-        lang = (language or "en").lower()
-        entry = DEFAULT_PROMPTS.get(message_type, {})
-        if isinstance(entry, dict):
-            template = ensure_string(entry.get(lang) or entry.get("en") or "")
-        else:
-            template = ensure_string(entry)
-
-    if not template:
-        return ""
-
-    try:
-        format_kwargs = {
-            k: v for k, v in kwargs.items() if k != "user_prompt_overrides"
-        }
-        if not template:
-            return ""
-        # if no format_kwargs, just return template to avoid KeyError
-        if not format_kwargs:
-            return template
-
-        # Use double braces to prevent .format() from interpreting them
-        safe_template = template.replace("{{", "DOUBLE_OPEN_BRACE").replace(
-            "}}", "DOUBLE_CLOSE_BRACE"
-        )
-        formatted = safe_template.format(**format_kwargs)
-        return formatted.replace("DOUBLE_OPEN_BRACE", "{").replace(
-            "DOUBLE_CLOSE_BRACE", "}"
-        )
-    except KeyError:
-        # If a placeholder is missing, return the unformatted template.
-        # This prevents crashes when new placeholders are added to JSON but
-        # not yet passed by all callsites.
-        return template
-    except Exception:
-        return template
+    # the only control key is ``user_prompt_overrides`` which is ignored.
+    template = _resolve_template(message_type, model_overrides, language)
+    format_kwargs = {k: v for k, v in kwargs.items() if k != "user_prompt_overrides"}
+    return _format_template(template, format_kwargs)
 
 
 def get_user_prompt(
@@ -214,40 +249,10 @@ def get_user_prompt(
     """
     # Allow per-request prompt overrides without mutating global defaults.
     overrides = kwargs.get("user_prompt_overrides", {})
-    if prompt_type in overrides:
-        template = ensure_string(overrides[prompt_type])
-    else:
-        entry = DEFAULT_PROMPTS.get(prompt_type, {})
-        lang = (language or "en").lower()
-        if isinstance(entry, dict):
-            template = ensure_string(entry.get(lang) or entry.get("en") or "")
-        else:
-            template = ensure_string(entry)
-
-    if not template:
-        return ""
-
-    try:
-        # Strip control keys so only template variables reach format().
-        format_kwargs = {
-            k: v for k, v in kwargs.items() if k != "user_prompt_overrides"
-        }
-        if not format_kwargs:
-            return template
-
-        # Use double braces to prevent .format() from interpreting them
-        safe_template = template.replace("{{", "DOUBLE_OPEN_BRACE").replace(
-            "}}", "DOUBLE_CLOSE_BRACE"
-        )
-        formatted = safe_template.format(**format_kwargs)
-        return formatted.replace("DOUBLE_OPEN_BRACE", "{").replace(
-            "DOUBLE_CLOSE_BRACE", "}"
-        )
-    except KeyError:
-        # If a placeholder is missing, return the unformatted template.
-        return template
-    except Exception:
-        return template
+    template = _resolve_template(prompt_type, overrides, language)
+    # Strip control keys so only template variables reach format().
+    format_kwargs = {k: v for k, v in kwargs.items() if k != "user_prompt_overrides"}
+    return _format_template(template, format_kwargs)
 
 
 def load_model_prompt_overrides(
@@ -117,26 +117,26 @@ def _load_chapter_titles(count: int, active: Path | None = None) -> List[str]:
     return titles[:count]
 
 
+def _sanitize_chapter_text(val: Any) -> str:
+    """Stringify and strip a chapter field, dropping the JS '[object Object]' leak."""
+    s = str(val if val is not None else "").strip()
+    if s.lower() == "[object object]":
+        return ""
+    return s
+
+
 def _normalize_chapter_entry(entry: Any) -> Dict[str, Any]:
     """Ensures a chapter entry is a dict with 'title', 'summary', 'filename'.
     Preserves other existing keys. Handles JS '[object Object]' leak.
     """
-
-    def _sanitize_text(val: Any) -> str:
-        """Helper for text.."""
-        s = str(val if val is not None else "").strip()
-        if s.lower() == "[object object]":
-            return ""
-        return s
-
     if isinstance(entry, dict):
         res = entry.copy()
-        res["title"] = _sanitize_text(res.get("title", ""))
-        res["summary"] = _sanitize_text(res.get("summary", ""))
-        res["filename"] = _sanitize_text(res.get("filename", ""))
+        res["title"] = _sanitize_chapter_text(res.get("title", ""))
+        res["summary"] = _sanitize_chapter_text(res.get("summary", ""))
+        res["filename"] = _sanitize_chapter_text(res.get("filename", ""))
         return res
     elif isinstance(entry, (str, int, float)):
-        return {"title": _sanitize_text(entry), "summary": "", "filename": ""}
+        return {"title": _sanitize_chapter_text(entry), "summary": "", "filename": ""}
     return {"title": "", "summary": "", "filename": ""}
 
 
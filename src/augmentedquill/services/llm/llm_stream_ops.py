@@ -294,10 +294,9 @@ async def unified_chat_stream(
                             content = message.get("content", "")
 
                             if content:
-                                events = parse_stream_channel_fragments(
+                                for event in parse_stream_channel_fragments(
                                     channel_filter.feed(content), sent_tool_call_ids
-                                )
-                                for event in events:
+                                ):
                                     yield event
 
                                 parsed_full = parse_complete_assistant_output(
@@ -377,10 +376,9 @@ async def unified_chat_stream(
                                     existing + assembled
                                 )
 
-                            events = parse_stream_channel_fragments(
+                            for event in parse_stream_channel_fragments(
                                 channel_filter.flush(), sent_tool_call_ids
-                            )
-                            for event in events:
+                            ):
                                 yield event
 
                             yield {"done": True}
@@ -432,11 +430,10 @@ async def unified_chat_stream(
                                         "full_content"
                                     ] += content
 
-                                events = parse_stream_channel_fragments(
+                                for event in parse_stream_channel_fragments(
                                     channel_filter.feed(content),
                                     sent_tool_call_ids,
-                                )
-                                for event in events:
+                                ):
                                     yield event
 
                             tc = delta.get("tool_calls")
@@ -98,6 +98,9 @@ def load_registry() -> Dict:
 def set_active_project(path: Path) -> None:
     """Set active project."""
     reg = load_registry()
+    if reg["current"] == str(path) and reg["recent"][:1] == [str(path)]:
+        # Re-selecting the active project would rewrite an identical registry.
+        return
     current, recent = set_active_project_in_registry(
         Path(os.getenv("AUGQ_PROJECTS_REGISTRY", str(DEFAULT_PROJECTS_REGISTRY_PATH))),
         path,
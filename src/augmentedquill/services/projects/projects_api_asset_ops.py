@@ -45,6 +45,18 @@ from augmentedquill.services.projects.projects_api_manage_ops import normalize_r
 from augmentedquill.models.story import ProjectMutationResponse
 
 _RESTORE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+# ``\w`` matches Unicode alphanumerics plus "_", mirroring ``str.isalnum``.
+_TARGET_NAME_STRIP_PATTERN = re.compile(r"[^\w.\-]")
+_PROJECT_NAME_STRIP_PATTERN = re.compile(r"[^\w \-]")
+
+# Last built export archive, keyed by project dir. The manifest holds
+# (relative path, mtime_ns, size) for every file so an unchanged project can
+# be re-exported without recompressing anything. Only one archive is kept, and
+# only if it is at most _EXPORT_CACHE_MAX_BYTES, so projects with large images
+# are rebuilt on every export rather than pinned in memory.
+_EXPORT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+_ExportManifest = tuple[tuple[str, int, int], ...]
+_export_cache: dict[Path, tuple[_ExportManifest, bytes]] = {}
 
 
 def _safe_child_path(base_dir: Path, *parts: str) -> Path:
@@ -102,7 +114,7 @@ def create_image_placeholder_response(payload: dict) -> JSONResponse:
 
 def _sanitize_target_name(raw: str) -> str:
     """Helper for target name.."""
-    return "".join(c for c in raw if c.isalnum() or c in "._-").strip()
+    return _TARGET_NAME_STRIP_PATTERN.sub("", raw).strip()
 
 
 def _get_deleted_images_dir(active: Path) -> Path:
@@ -264,6 +276,46 @@ def get_image_file_response(filename: str) -> FileResponse:
     return FileResponse(img_path)
 
 
+def _export_manifest(project_dir: Path) -> _ExportManifest:
+    """Collect path, mtime and size of every file below *project_dir*."""
+    entries: list[tuple[str, int, int]] = []
+    for root, _, files in shutil.os.walk(project_dir):
+        for file in files:
+            file_path = Path(root) / file
+            stat = file_path.stat()
+            entries.append(
+                (
+                    file_path.relative_to(project_dir).as_posix(),
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                )
+            )
+    entries.sort()
+    return tuple(entries)
+
+
+def _build_export_zip(project_dir: Path) -> bytes:
+    """Return the ZIP archive of *project_dir*, reusing the last one if unchanged.
+
+    Archives larger than ``_EXPORT_CACHE_MAX_BYTES`` are not cached.
+    """
+    manifest = _export_manifest(project_dir)
+    cached = _export_cache.get(project_dir)
+    if cached and cached[0] == manifest:
+        return cached[1]
+
+    mem_zip = io.BytesIO()
+    with zipfile.ZipFile(mem_zip, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for archive_name, _, _ in manifest:
+            zf.write(project_dir / archive_name, arcname=archive_name)
+
+    content = mem_zip.getvalue()
+    _export_cache.clear()
+    if len(content) <= _EXPORT_CACHE_MAX_BYTES:
+        _export_cache[project_dir] = (manifest, content)
+    return content
+
+
 def export_project_response(name: str | None = None) -> Response:
     """Export Project Response."""
     projects_root = get_projects_root()
@@ -284,17 +336,8 @@ def export_project_response(name: str | None = None) -> Response:
     if not resolved_path.exists():
         raise BadRequestError("Project not found")
 
-    mem_zip = io.BytesIO()
-    with zipfile.ZipFile(mem_zip, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for root, _, files in shutil.os.walk(resolved_path):
-            for file in files:
-                file_path = Path(root) / file
-                archive_name = file_path.relative_to(resolved_path)
-                zf.write(file_path, arcname=archive_name)
-
-    mem_zip.seek(0)
     return Response(
-        content=mem_zip.getvalue(),
+        content=_build_export_zip(resolved_path),
         media_type="application/zip",
         headers={
             "Content-Disposition": f"attachment; filename={resolved_path.name}.zip"
@@ -339,9 +382,7 @@ async def import_project_response(file: UploadFile) -> ProjectMutationResponse:
 
         story = load_story_config(temp_dir / "story.json") or {}
         proposed_name = story.get("project_title") or "imported_project"
-        proposed_name = "".join(
-            x for x in proposed_name if x.isalnum() or x in " -_"
-        ).strip()
+        proposed_name = _PROJECT_NAME_STRIP_PATTERN.sub("", proposed_name).strip()
         if not proposed_name:
             proposed_name = "imported_project"
 
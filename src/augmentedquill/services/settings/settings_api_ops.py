@@ -58,6 +58,23 @@ def build_story_cfg_from_payload(story: dict) -> dict:
     }
 
 
+def _check_unique_names(models: list) -> tuple[list[tuple[str, dict]], str | None]:
+    """Pair each model dict with its stripped name, rejecting empty or duplicate names."""
+    rows: list[tuple[str, dict]] = []
+    seen: set[str] = set()
+    for model in models:
+        if not isinstance(model, dict):
+            continue
+        name = (model.get("name") or "").strip()
+        if not name:
+            return [], "Each model must have a unique, non-empty name."
+        if name in seen:
+            return [], f"Duplicate model name not allowed: {name}"
+        seen.add(name)
+        rows.append((name, model))
+    return rows, None
+
+
 def validate_and_fill_openai_cfg_for_settings(
     openai_cfg: dict,
 ) -> tuple[dict | None, str | None]:
@@ -71,21 +88,9 @@ def validate_and_fill_openai_cfg_for_settings(
     if not (isinstance(models, list) and models):
         return None, "At least one model must be configured in openai.models[]."
 
-    name_counts: dict[str, int] = {}
-    for model in models:
-        if not isinstance(model, dict):
-            continue
-        name = (model.get("name", "") or "").strip()
-        if not name:
-            return None, "Each model must have a unique, non-empty name."
-        name_counts[name] = name_counts.get(name, 0) + 1
-
-    dups = [name for name, count in name_counts.items() if count > 1]
-    if dups:
-        return (
-            None,
-            f"Duplicate model name(s) not allowed: {', '.join(sorted(set(dups)))}",
-        )
+    _, err = _check_unique_names(models)
+    if err:
+        return None, err
 
     if not selected:
         selected = models[0].get("name", "") if models else ""
@@ -128,12 +133,12 @@ def clean_machine_openai_cfg_for_put(
     if not (isinstance(models, list) and models):
         return None, None, "At least one model must be configured in openai.models[]."
 
-    name_counts: dict[str, int] = {}
+    rows, err = _check_unique_names(models)
+    if err:
+        return None, None, err
+
     cleaned_models: list[dict] = []
-    for model in models:
-        if not isinstance(model, dict):
-            continue
-        name = (model.get("name") or "").strip()
+    for name, model in rows:
         base_url = (model.get("base_url") or "").strip()
         model_id = (model.get("model") or "").strip()
         api_key = model.get("api_key")
@@ -141,14 +146,11 @@ def clean_machine_openai_cfg_for_put(
         context_window_tokens = model.get("context_window_tokens")
         prompt_overrides = model.get("prompt_overrides", {})
 
-        if not name:
-            return None, None, "Each model must have a unique, non-empty name."
         if not base_url:
             return None, None, f"Model '{name}' is missing base_url."
         if not model_id:
             return None, None, f"Model '{name}' is missing model."
 
-        name_counts[name] = name_counts.get(name, 0) + 1
         try:
             timeout_s_int = int(timeout_s)
         except Exception:
@@ -213,14 +215,6 @@ def clean_machine_openai_cfg_for_put(
             }
         )
 
-    dups = [name for name, count in name_counts.items() if count > 1]
-    if dups:
-        return (
-            None,
-            None,
-            f"Duplicate model name(s) not allowed: {', '.join(sorted(set(dups)))}",
-        )
-
     if not selected:
         selected = cleaned_models[0].get("name", "")
     elif selected not in [model.get("name") for model in cleaned_models]:
@@ -9,11 +9,12 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any
 from pathlib import Path
 
 from augmentedquill.services.llm import llm
-from augmentedquill.core.config import load_machine_config
+from augmentedquill.core.config import load_machine_config, machine_config_env_vars
 from augmentedquill.core.prompts import (
     get_system_message,
     get_user_prompt,
@@ -50,14 +51,92 @@ def _get_read_only_tool_schemas(project_type: str | None = None) -> list[dict]:
     return [t for t in tools if t.get("function", {}).get("name") in relevant_names]
 
 
+def _read_only_tool_instructions(
+    model_overrides: dict,
+    language: str | None = None,
+    project_type: str | None = None,
+) -> str:
+    """Render the tool instruction block listing the read-only context tools."""
+    tool_lines: list[str] = []
+    for t in _get_read_only_tool_schemas(project_type=project_type):
+        function = t.get("function", {})
+        fn = function.get("name")
+        if not fn:
+            continue
+        desc = function.get("description", "")
+        tool_lines.append(f"- {fn}: {desc}" if desc else f"- {fn}")
+    if not tool_lines:
+        return ""
+    return get_system_message(
+        "tool_instruction_block",
+        model_overrides,
+        language=language,
+        tools_list="\n".join(tool_lines),
+    )
+
+
+# Parsed machine configs keyed by path. Each entry holds the file's
+# (mtime_ns, size) signature, the environment variables the config depends on
+# with their values at load time, the parsed config and the prompt overrides
+# already resolved per model name, so unchanged files are not re-read.
+_machine_config_cache: dict[
+    Path,
+    tuple[
+        tuple[int, int],
+        tuple[str, ...],
+        tuple[str | None, ...],
+        dict,
+        dict[str | None, dict],
+    ],
+] = {}
+
+
+def _load_model_overrides_cached(path: Path, model_name: str | None) -> dict:
+    """Return prompt overrides for *model_name*, reusing parses of unchanged files.
+
+    A cached parse is reused only while the file signature and the values of
+    the environment variables it interpolates or is overridden by are unchanged.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        machine_config = load_machine_config(path) or {}
+        return load_model_prompt_overrides(machine_config, model_name)
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    entry = _machine_config_cache.get(path)
+    if (
+        entry is None
+        or entry[0] != signature
+        or entry[2] != tuple(os.environ.get(name) for name in entry[1])
+    ):
+        env_names = machine_config_env_vars(path)
+        entry = (
+            signature,
+            env_names,
+            tuple(os.environ.get(name) for name in env_names),
+            load_machine_config(path) or {},
+            {},
+        )
+        _machine_config_cache[path] = entry
+
+    overrides_by_model = entry[4]
+    if model_name not in overrides_by_model:
+        overrides_by_model[model_name] = load_model_prompt_overrides(
+            entry[3], model_name
+        )
+    return dict(overrides_by_model[model_name])
+
+
 def resolve_model_runtime(payload: dict, model_type: str, base_dir: Path) -> Any:
     """Resolve runtime model credentials and prompt overrides for a request."""
     base_url, api_key, model_id, timeout_s, model_name = llm.resolve_openai_credentials(
         payload, model_type=model_type
     )
-    machine_config = load_machine_config(base_dir / "config" / "machine.json") or {}
     # model_name returned from resolve_openai_credentials is the selected name!
-    model_overrides = load_model_prompt_overrides(machine_config, model_name)
+    model_overrides = _load_model_overrides_cached(
+        base_dir / "config" / "machine.json", model_name
+    )
     return (
         base_url,
         api_key,
@@ -126,50 +205,31 @@ def build_chapter_summary_messages(
             )
         )
 
-    tools = _get_read_only_tool_schemas(project_type=project_type)
-    if tools:
-        tool_lines: list[str] = []
-        for t in tools:
-            fn = t.get("function", {}).get("name")
-            if not fn:
-                continue
-            desc = t.get("function", {}).get("description", "")
-            if desc:
-                tool_lines.append(f"- {fn}: {desc}")
-            else:
-                tool_lines.append(f"- {fn}")
-        tools_list = "\n".join(tool_lines)
-
-        sys_parts.append(
-            get_system_message(
-                "tool_instruction_block",
-                model_overrides,
-                language=language,
-                tools_list=tools_list,
-            )
-        )
+    tool_instructions = _read_only_tool_instructions(
+        model_overrides, language=language, project_type=project_type
+    )
+    if tool_instructions:
+        sys_parts.append(tool_instructions)
 
     sys_msg = {
         "role": "system",
         "content": "\n\n".join(part for part in sys_parts if part),
     }
+    prompt_kwargs: dict[str, Any] = {
+        "content_label": content_label,
+        "chapter_text": chapter_text,
+    }
     if mode == "discard" or not current_summary:
-        user_prompt = get_user_prompt(
-            "chapter_summary_new",
-            language=language,
-            content_label=content_label,
-            chapter_text=chapter_text,
-            user_prompt_overrides=model_overrides,
-        )
+        user_prompt_key = "chapter_summary_new"
     else:
-        user_prompt = get_user_prompt(
-            "chapter_summary_update",
-            language=language,
-            content_label=content_label,
-            existing_summary=current_summary,
-            chapter_text=chapter_text,
-            user_prompt_overrides=model_overrides,
-        )
+        user_prompt_key = "chapter_summary_update"
+        prompt_kwargs["existing_summary"] = current_summary
+    user_prompt = get_user_prompt(
+        user_prompt_key,
+        language=language,
+        user_prompt_overrides=model_overrides,
+        **prompt_kwargs,
+    )
     return [sys_msg, {"role": "user", "content": user_prompt}]
 
 
@@ -188,50 +248,31 @@ def build_story_summary_messages(
         get_system_message("story_summarizer", model_overrides, language=language)
     ]
 
-    tools = _get_read_only_tool_schemas(project_type=project_type)
-    if tools:
-        tool_lines: list[str] = []
-        for t in tools:
-            fn = t.get("function", {}).get("name")
-            if not fn:
-                continue
-            desc = t.get("function", {}).get("description", "")
-            if desc:
-                tool_lines.append(f"- {fn}: {desc}")
-            else:
-                tool_lines.append(f"- {fn}")
-        tools_list = "\n".join(tool_lines)
-
-        sys_parts.append(
-            get_system_message(
-                "tool_instruction_block",
-                model_overrides,
-                language=language,
-                tools_list=tools_list,
-            )
-        )
+    tool_instructions = _read_only_tool_instructions(
+        model_overrides, language=language, project_type=project_type
+    )
+    if tool_instructions:
+        sys_parts.append(tool_instructions)
 
     sys_msg = {
         "role": "system",
         "content": "\n\n".join(sys_parts),
     }
+    prompt_kwargs: dict[str, Any] = {
+        "summary_heading": summary_heading,
+        "source_summaries": "\n\n".join(source_summaries),
+    }
     if mode == "discard" or not current_story_summary:
-        user_prompt = get_user_prompt(
-            "story_summary_new",
-            language=language,
-            summary_heading=summary_heading,
-            source_summaries="\n\n".join(source_summaries),
-            user_prompt_overrides=model_overrides,
-        )
+        user_prompt_key = "story_summary_new"
     else:
-        user_prompt = get_user_prompt(
-            "story_summary_update",
-            language=language,
-            existing_summary=current_story_summary,
-            summary_heading=summary_heading,
-            source_summaries="\n\n".join(source_summaries),
-            user_prompt_overrides=model_overrides,
-        )
+        user_prompt_key = "story_summary_update"
+        prompt_kwargs["existing_summary"] = current_story_summary
+    user_prompt = get_user_prompt(
+        user_prompt_key,
+        language=language,
+        user_prompt_overrides=model_overrides,
+        **prompt_kwargs,
+    )
     return [sys_msg, {"role": "user", "content": user_prompt}]
 
 
@@ -301,6 +342,44 @@ def build_continue_chapter_messages(
     )
 
 
+# (system message key, user prompt key) for summary-style AI actions, keyed by
+# (target, writes_fresh_summary). ``"story_summary:short-story"`` summarizes the
+# story draft itself and so reuses the chapter-summary user templates.
+_SUMMARY_ACTION_PROMPT_KEYS: dict[tuple[str, bool], tuple[str, str]] = {
+    ("summary", True): ("ai_action_summary_rewrite", "chapter_summary_new"),
+    ("summary", False): ("ai_action_summary_update", "chapter_summary_update"),
+    ("book_summary", True): ("ai_action_summary_rewrite", "story_summary_new"),
+    ("book_summary", False): ("ai_action_summary_rewrite", "story_summary_update"),
+    ("story_summary", True): ("ai_action_summary_rewrite", "story_summary_new"),
+    ("story_summary", False): ("ai_action_summary_rewrite", "story_summary_update"),
+    ("story_summary:short-story", True): (
+        "ai_action_summary_rewrite",
+        "chapter_summary_new",
+    ),
+    ("story_summary:short-story", False): (
+        "ai_action_summary_rewrite",
+        "chapter_summary_update",
+    ),
+}
+
+
+def _ai_action_prompt_keys(
+    target: str, action: str, project_type: str | None
+) -> tuple[str, str]:
+    """Map an AI action target/action pair to its system and user prompt keys."""
+    if target == "story_summary" and project_type == "short-story":
+        target = "story_summary:short-story"
+    # 'write' generates a new summary, 'rewrite' replaces an existing one;
+    # anything else updates the existing summary.
+    keys = _SUMMARY_ACTION_PROMPT_KEYS.get((target, action in ("write", "rewrite")))
+    if keys is not None:
+        return keys
+    # Keep chapter Extend/Rewrite on a shared continuation-style prompt path.
+    if action in ("extend", "rewrite"):
+        return "ai_action_chapter_extend", "chapter_ai_prefill_task"
+    return f"ai_action_chapter_{action}", f"ai_action_chapter_{action}_user"
+
+
 def build_ai_action_messages(
     *,
     target: str,
@@ -324,55 +403,7 @@ def build_ai_action_messages(
 ) -> Any:
     """Build messages for generic AI Actions (Extend/Rewrite/Summary)."""
     _ensure_tools_loaded()
-    # Map target/action to prompt keys
-    if target == "summary":
-        # 'write' is used for generating a new summary (empty or missing existing summary)
-        # 'rewrite' is used for rewriting an existing summary.
-        if action in ("write", "rewrite"):
-            sys_key = "ai_action_summary_rewrite"
-            user_key = "chapter_summary_new"
-        else:
-            sys_key = "ai_action_summary_update"
-            user_key = "chapter_summary_update"
-    elif target == "book_summary":
-        sys_key = "ai_action_summary_rewrite"
-        user_key = (
-            "story_summary_new"
-            if action in ("write", "rewrite")
-            else "story_summary_update"
-        )
-    elif target == "story_summary":
-        sys_key = "ai_action_summary_rewrite"
-        if project_type == "short-story":
-            # Short-story has no chapters; use the story draft text as the source
-            # (same template family as chapter summaries, with chapter_text = story draft).
-            user_key = (
-                "chapter_summary_new"
-                if action in ("write", "rewrite")
-                else "chapter_summary_update"
-            )
-        else:
-            # Novel/series: source material is chapter or book summaries.
-            user_key = (
-                "story_summary_new"
-                if action in ("write", "rewrite")
-                else "story_summary_update"
-            )
-    else:
-        # Keep chapter Extend/Rewrite on a shared continuation-style prompt path.
-        if action in ("extend", "rewrite"):
-            sys_key = "ai_action_chapter_extend"
-            user_key = "chapter_ai_prefill_task"
-        else:
-            sys_key = f"ai_action_chapter_{action}"
-            user_key = f"ai_action_chapter_{action}_user"
-
-    # User templates for chapter AI actions are currently the standard chapter templates.
-    if user_key.startswith("ai_action_chapter_"):
-        if action == "extend":
-            user_key = "continue_chapter"
-        elif action == "rewrite":
-            user_key = "continue_chapter"
+    sys_key, user_key = _ai_action_prompt_keys(target, action, project_type)
 
     # Additional placeholders for EDITING tasks
     story_context = ""
@@ -387,27 +418,9 @@ def build_ai_action_messages(
                 story_tags=story_tags,
             )
 
-        tools = _get_read_only_tool_schemas(project_type=project_type)
-        if tools:
-            tool_lines: list[str] = []
-            for t in tools:
-                fn = t.get("function", {}).get("name")
-                if not fn:
-                    continue
-                desc = t.get("function", {}).get("description", "")
-                if desc:
-                    tool_lines.append(f"- {fn}: {desc}")
-                else:
-                    tool_lines.append(f"- {fn}")
-
-            tools_list = "\n".join(tool_lines)
-
-            tool_instructions = get_system_message(
-                "tool_instruction_block",
-                model_overrides,
-                language=language,
-                tools_list=tools_list,
-            )
+        tool_instructions = _read_only_tool_instructions(
+            model_overrides, language=language, project_type=project_type
+        )
 
     # Prefer a localized label for the provided text when available.
     if content_label is None:
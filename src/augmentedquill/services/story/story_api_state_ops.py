@@ -37,7 +37,7 @@ def read_text_or_raise(path: Path, message: str = "Failed to read chapter") -> s
     """Read text or raise."""
     try:
         return path.read_text(encoding="utf-8")
-    except Exception as exc:
+    except (OSError, UnicodeDecodeError) as exc:
         raise PersistenceError(f"{message}: {exc}") from exc
 
 
@@ -53,31 +53,37 @@ def get_all_normalized_chapters(story: dict) -> list[dict]:
     For novel/short-story projects, chapters come from the top-level chapters list.
     """
     if story.get("project_type") == "series":
-        chapters: list[dict] = []
-        for book in story.get("books", []):
-            if isinstance(book, dict):
-                for chapter in book.get("chapters", []):
-                    chapters.append(_normalize_chapter_entry(chapter))
-        return chapters
+        return [
+            _normalize_chapter_entry(chapter)
+            for book in story.get("books", [])
+            if isinstance(book, dict)
+            for chapter in book.get("chapters", [])
+        ]
     return get_normalized_chapters(story)
 
 
 def ensure_chapter_slot(chapters_data: list[dict], pos: int) -> None:
     """Ensure chapter slot."""
     if pos >= len(chapters_data):
+        # One fresh dict per slot; list multiplication would alias them all.
         chapters_data.extend(
-            [{"title": "", "summary": ""}] * (pos - len(chapters_data) + 1)
+            {"title": "", "summary": ""} for _ in range(pos - len(chapters_data) + 1)
         )
 
 
 def collect_chapter_summaries(chapters_data: list[dict]) -> list[str]:
-    """Collect Chapter Summaries."""
+    """Collect Chapter Summaries.
+
+    Expects entries from get_normalized_chapters/get_all_normalized_chapters,
+    whose title and summary are already stripped strings.
+    """
     chapter_summaries: list[str] = []
     for index, chapter in enumerate(chapters_data):
-        summary = chapter.get("summary", "").strip()
-        title = chapter.get("title", "").strip() or f"Chapter {index + 1}"
-        if summary:
-            chapter_summaries.append(f"{title}:\n{summary}")
+        summary = chapter.get("summary")
+        if not summary:
+            continue
+        title = chapter.get("title") or f"Chapter {index + 1}"
+        chapter_summaries.append(f"{title}:\n{summary}")
     return chapter_summaries
 
 
@@ -88,7 +94,8 @@ def collect_book_summaries(books_data: list[dict]) -> list[str]:
         if not isinstance(book, dict):
             continue
         summary = str(book.get("summary", "")).strip()
+        if not summary:
+            continue
         title = str(book.get("title", "")).strip() or f"Book {index + 1}"
-        if summary:
-            book_summaries.append(f"{title}:\n{summary}")
+        book_summaries.append(f"{title}:\n{summary}")
     return book_summaries
@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 from collections.abc import AsyncIterator, Callable
 
@@ -20,6 +21,25 @@ from augmentedquill.services.chat.chat_tool_decorator import (
     tool_message,
 )
 
+# Plain content/thinking fragments arriving within this window, or until this
+# many characters are pending, are merged into one event to cut per-event
+# overhead downstream. Set either value to 0 to forward every fragment as is.
+STREAM_COALESCE_WINDOW_S = 0.02
+STREAM_COALESCE_MAX_CHARS = 64
+_COALESCABLE_KEYS = ("content", "thinking")
+# Returned by anext() once a round's upstream stream is exhausted.
+_STREAM_END = object()
+
+
+def _coalescable_key(chunk_dict: dict) -> str | None:
+    """Return the text key if *chunk_dict* carries nothing but one text fragment."""
+    if len(chunk_dict) != 1:
+        return None
+    for key in _COALESCABLE_KEYS:
+        if isinstance(chunk_dict.get(key), str):
+            return key
+    return None
+
 
 async def stream_unified_chat_content(
     *,
@@ -45,6 +65,12 @@ async def stream_unified_chat_content(
         # Seed the assistant turn so generation continues from this exact prefix.
         current_messages.append({"role": "assistant", "content": response_prefill})
 
+    loop = asyncio.get_running_loop()
+    pending_key: str | None = None
+    pending_parts: list[str] = []
+    pending_len = 0
+    flush_at = loop.time()
+
     for round_idx in range(max_rounds):
         round_content = ""
         round_thinking = ""
@@ -52,7 +78,7 @@ async def stream_unified_chat_content(
         # Native streaming tool call fragments keyed by delta index
         _tc_acc: dict[int, dict] = {}
 
-        async for chunk_dict in llm.unified_chat_stream(
+        stream = llm.unified_chat_stream(
             caller_id="story_api_stream.stream_unified_chat_content",
             messages=current_messages,
             base_url=base_url,
@@ -63,35 +89,89 @@ async def stream_unified_chat_content(
             model_type=model_type,
             tools=tools,
             extra_body=extra_body,
-        ):
-            # Yield everything from the stream to the frontend
-            yield chunk_dict
-
-            # Accumulate values for the next round if needed
-            if chunk_dict.get("content"):
-                round_content += chunk_dict["content"]
-            if chunk_dict.get("thinking"):
-                round_thinking += chunk_dict["thinking"]
-
-            tc = chunk_dict.get("tool_calls")
-            if tc:
-                for tc_delta in tc:
-                    idx = tc_delta.get("index") or 0
-                    if idx not in _tc_acc:
-                        _tc_acc[idx] = {
-                            "id": "",
-                            "type": "function",
-                            "function": {"name": "", "arguments": ""},
-                        }
-                    if tc_delta.get("id"):
-                        _tc_acc[idx]["id"] = tc_delta["id"]
-                    if tc_delta.get("type"):
-                        _tc_acc[idx]["type"] = tc_delta["type"]
-                    fn = tc_delta.get("function") or {}
-                    if fn.get("name"):
-                        _tc_acc[idx]["function"]["name"] += fn["name"]
-                    if fn.get("arguments"):
-                        _tc_acc[idx]["function"]["arguments"] += fn["arguments"]
+        )
+        next_chunk: asyncio.Future | None = None
+        try:
+            while True:
+                if pending_parts and next_chunk is None:
+                    # Text is held back, so read upstream in a task that can be
+                    # waited on with a timeout; otherwise await it directly.
+                    next_chunk = asyncio.ensure_future(anext(stream, _STREAM_END))
+                if next_chunk is None:
+                    chunk_dict = await anext(stream, _STREAM_END)
+                else:
+                    if pending_parts and not next_chunk.done():
+                        # Wait for upstream only until the window closes; a
+                        # stalled provider must not hold back text that
+                        # already arrived.
+                        await asyncio.wait(
+                            {next_chunk}, timeout=max(0.0, flush_at - loop.time())
+                        )
+                        if not next_chunk.done():
+                            yield {pending_key: "".join(pending_parts)}
+                            pending_parts.clear()
+                            pending_len = 0
+                            flush_at = loop.time() + STREAM_COALESCE_WINDOW_S
+                            continue
+                    chunk_dict = await next_chunk
+                    next_chunk = None
+                if chunk_dict is _STREAM_END:
+                    break
+
+                # Yield everything from the stream to the frontend, merging bursts
+                # of small text fragments into one event.
+                text_key = _coalescable_key(chunk_dict)
+                if pending_parts and text_key != pending_key:
+                    yield {pending_key: "".join(pending_parts)}
+                    pending_parts.clear()
+                    pending_len = 0
+                if text_key is None:
+                    yield chunk_dict
+                else:
+                    pending_key = text_key
+                    pending_parts.append(chunk_dict[text_key])
+                    pending_len += len(chunk_dict[text_key])
+                    now = loop.time()
+                    if pending_len >= STREAM_COALESCE_MAX_CHARS or now >= flush_at:
+                        yield {text_key: "".join(pending_parts)}
+                        pending_parts.clear()
+                        pending_len = 0
+                        flush_at = now + STREAM_COALESCE_WINDOW_S
+
+                # Accumulate values for the next round if needed
+                if chunk_dict.get("content"):
+                    round_content += chunk_dict["content"]
+                if chunk_dict.get("thinking"):
+                    round_thinking += chunk_dict["thinking"]
+
+                tc = chunk_dict.get("tool_calls")
+                if tc:
+                    for tc_delta in tc:
+                        idx = tc_delta.get("index") or 0
+                        if idx not in _tc_acc:
+                            _tc_acc[idx] = {
+                                "id": "",
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            }
+                        if tc_delta.get("id"):
+                            _tc_acc[idx]["id"] = tc_delta["id"]
+                        if tc_delta.get("type"):
+                            _tc_acc[idx]["type"] = tc_delta["type"]
+                        fn = tc_delta.get("function") or {}
+                        if fn.get("name"):
+                            _tc_acc[idx]["function"]["name"] += fn["name"]
+                        if fn.get("arguments"):
+                            _tc_acc[idx]["function"]["arguments"] += fn["arguments"]
+        finally:
+            if next_chunk is not None:
+                # Consumer went away mid-wait: stop the pending upstream read.
+                next_chunk.cancel()
+
+        if pending_parts:
+            yield {pending_key: "".join(pending_parts)}
+            pending_parts.clear()
+            pending_len = 0
 
         # Once the stream for this round is finished, check if we have tool calls to execute
         round_tool_calls = list(_tc_acc.values())
@@ -154,19 +234,19 @@ async def stream_collect_and_persist(
     `content` fragments as plain strings. That makes it compatible with
     Starlette StreamingResponse which expects byte/str chunks.
     """
-    buf: list[str] = []
+    buf = io.StringIO()
     try:
         async for chunk_dict in stream_factory():
             content = chunk_dict.get("content", "")
             if content:
                 # Store transformed (raw) chunk for persistence
                 raw_chunk = chunk_transformer(content) if chunk_transformer else content
-                buf.append(raw_chunk)
+                buf.write(raw_chunk)
             yield content
     except asyncio.CancelledError:
         return
 
     try:
-        persist_on_complete("".join(buf))
+        persist_on_complete(buf.getvalue())
     except Exception:
         pass
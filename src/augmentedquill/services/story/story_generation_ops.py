@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from augmentedquill.core.config import save_story_config
@@ -18,9 +19,6 @@ from augmentedquill.services.chat.chat_tool_decorator import (
     tool_message,
 )
 from augmentedquill.services.llm import llm
-from augmentedquill.services.story.story_api_prompt_ops import (  # noqa: F401
-    resolve_model_runtime,
-)
 from augmentedquill.services.story.story_generation_common import (
     prepare_chapter_summary_generation,
     prepare_continue_chapter_generation,
@@ -111,7 +109,9 @@ async def generate_story_summary(
     if mode.lower() == "discard":
         backup_summary = prepared["story"].get("story_summary", "")
         prepared["story"]["story_summary"] = ""
-        save_story_config(prepared["story_path"], prepared["story"])
+        await asyncio.to_thread(
+            save_story_config, prepared["story_path"], prepared["story"]
+        )
 
     try:
         data = await _complete_with_tool_calls(
@@ -128,12 +128,18 @@ async def generate_story_summary(
     except Exception:
         if mode.lower() == "discard":
             prepared["story"]["story_summary"] = backup_summary or ""
-            save_story_config(prepared["story_path"], prepared["story"])
+            await asyncio.to_thread(
+                save_story_config, prepared["story_path"], prepared["story"]
+            )
         raise
 
     new_summary = data.get("content", "")
     prepared["story"]["story_summary"] = new_summary
-    save_story_config(prepared["story_path"], prepared["story"])
+    # Serializing story.json can take a while on large projects; do it in a
+    # worker thread so other requests keep streaming meanwhile.
+    await asyncio.to_thread(
+        save_story_config, prepared["story_path"], prepared["story"]
+    )
     return {"ok": True, "summary": new_summary}
 
 
@@ -146,14 +152,20 @@ async def generate_chapter_summary(
 ) -> dict:
     """Generate Chapter Summary."""
     payload = payload or {}
-    prepared = prepare_chapter_summary_generation(payload, chap_id, mode, active=active)
+    # Preparation reads the chapter file and story.json; keep that blocking
+    # I/O off the event loop.
+    prepared = await asyncio.to_thread(
+        prepare_chapter_summary_generation, payload, chap_id, mode, active=active
+    )
 
     backup_summary = None
     if mode.lower() == "discard":
         backup_summary = prepared["chapters_data"][prepared["pos"]].get("summary", "")
         prepared["chapters_data"][prepared["pos"]]["summary"] = ""
         prepared["story"]["chapters"] = prepared["chapters_data"]
-        save_story_config(prepared["story_path"], prepared["story"])
+        await asyncio.to_thread(
+            save_story_config, prepared["story_path"], prepared["story"]
+        )
 
     try:
         data = await _complete_with_tool_calls(
@@ -171,13 +183,17 @@ async def generate_chapter_summary(
         if mode.lower() == "discard":
             prepared["chapters_data"][prepared["pos"]]["summary"] = backup_summary or ""
             prepared["story"]["chapters"] = prepared["chapters_data"]
-            save_story_config(prepared["story_path"], prepared["story"])
+            await asyncio.to_thread(
+                save_story_config, prepared["story_path"], prepared["story"]
+            )
         raise
 
     new_summary = data.get("content", "")
     prepared["chapters_data"][prepared["pos"]]["summary"] = new_summary
     prepared["story"]["chapters"] = prepared["chapters_data"]
-    save_story_config(prepared["story_path"], prepared["story"])
+    await asyncio.to_thread(
+        save_story_config, prepared["story_path"], prepared["story"]
+    )
 
     title_for_response = (
         prepared["chapters_data"][prepared["pos"]].get("title") or prepared["path"].name
@@ -213,7 +229,7 @@ async def write_chapter_from_summary(
     )
 
     content = data.get("content", "")
-    prepared["path"].write_text(content, encoding="utf-8")
+    await asyncio.to_thread(prepared["path"].write_bytes, content.encode("utf-8"))
     return {"ok": True, "content": content}
 
 
@@ -222,7 +238,9 @@ async def continue_chapter_from_summary(
 ) -> dict:
     """Continue Chapter From Summary."""
     payload = payload or {}
-    prepared = prepare_continue_chapter_generation(payload, chap_id, active=active)
+    prepared = await asyncio.to_thread(
+        prepare_continue_chapter_generation, payload, chap_id, active=active
+    )
 
     data = await llm.unified_chat_complete(
         caller_id="story_generation.continue_chapter_from_summary",
@@ -236,15 +254,9 @@ async def continue_chapter_from_summary(
     )
 
     appended = data.get("content", "")
-    new_content = (
-        prepared["existing"]
-        + (
-            "\n"
-            if prepared["existing"] and not prepared["existing"].endswith("\n")
-            else ""
-        )
-        + appended
-    )
-    prepared["path"].write_text(new_content, encoding="utf-8")
+    existing = prepared["existing"]
+    separator = "\n" if existing and not existing.endswith("\n") else ""
+    new_content = "".join((existing, separator, appended))
+    await asyncio.to_thread(prepared["path"].write_bytes, new_content.encode("utf-8"))
 
     return {"ok": True, "appended": appended, "content": new_content}
@@ -14,9 +14,104 @@ from __future__ import annotations
 
 import json as _json
 import re
+from collections.abc import Iterator
 from typing import Any
 from augmentedquill.utils.json_repair import try_parse_json_robust
 
+# Patterns used on every assistant message are compiled once at import time.
+_CHANNEL_MARKER_PATTERN = re.compile(r"<\|?channel", re.IGNORECASE)
+_LEAKED_THOUGHT_HEADER_PATTERN = re.compile(
+    r"<\|?channel\|?>\s*(thought|thinking|analysis|reasoning)\s*<\|?channel\|?>",
+    re.IGNORECASE,
+)
+# Block bodies below are written as possessive "unrolled loops" (runs of
+# ordinary characters, or a delimiter character that does not start the
+# closer) instead of lazy ``.*?``. They match the same spans but never
+# backtrack, so unterminated or very long blocks stay linear.
+_REASONING_BLOCK_PATTERN = re.compile(
+    r"<\|channel\|>\s*(analysis|thinking|thought|reasoning)\s*<\|message\|>"
+    r"(?:[^<\n]++|\n(?!\Z)|<(?!\|channel\|>\s*final\s*<\|message\|>))*+"
+    r"(?=(<\|channel\|>\s*final\s*<\|message\|>|$))",
+    re.IGNORECASE | re.DOTALL,
+)
+_MALFORMED_CHANNEL_HEADER_PATTERN = re.compile(
+    r"<\|?channel\|?>\s*(?:analysis|thought|thinking|reasoning|final)\s*<\|?channel\|?>",
+    re.IGNORECASE,
+)
+_CLOSED_THOUGHT_PATTERN = re.compile(
+    r"<(thought|thinking|think)>(?:[^<]++|<(?!/\1>))*+</\1>", re.IGNORECASE
+)
+_UNCLOSED_THOUGHT_PATTERN = re.compile(r"<(thought|thinking|think)>.*$", re.IGNORECASE)
+_CHANNEL_TOKEN_PATTERN = re.compile(r"<\|?channel\|?>", re.IGNORECASE)
+_MESSAGE_TOKEN_PATTERN = re.compile(r"<\|?message\|?>", re.IGNORECASE)
+_START_ASSISTANT_TOKEN_PATTERN = re.compile(r"<\|?start\|?>assistant", re.IGNORECASE)
+_END_TOKEN_PATTERN = re.compile(r"<\|?end\|?>", re.IGNORECASE)
+_MARKER_LABEL_PREFIX_PATTERN = re.compile(
+    r"^\s*(thought|thinking|analysis|reasoning|final)\b", re.IGNORECASE
+)
+_MARKER_LABEL_STRIP_PATTERN = re.compile(
+    r"^\s*(thought|thinking|analysis|reasoning|final)\s*", re.IGNORECASE
+)
+
+_STANDALONE_MARKER_WORDS = frozenset(
+    {"thought", "thinking", "think", "analysis", "reasoning", "final"}
+)
+
+_REASONING_CHANNELS = frozenset({"thinking", "thought", "analysis", "reasoning"})
+
+# Arguments string for tool calls that carry no arguments.
+_EMPTY_ARGS_JSON = "{}"
+
+_XML_FUNCTION_PATTERN = re.compile(
+    r"<function=(\w+)>(.*?)</function>", re.IGNORECASE | re.DOTALL
+)
+_XML_PARAMETER_PATTERN = re.compile(
+    r"<parameter=([^>\s]+)>(.*?)</parameter>", re.IGNORECASE | re.DOTALL
+)
+
+_CALL_COLON_PATTERN = re.compile(r"^call:(\w+)\s*\{(.*)\}\s*$", re.DOTALL)
+_UNQUOTED_KEY_PATTERN = re.compile(r"([A-Za-z0-9_]+)\s*:")
+_FUNC_PAREN_PATTERN = re.compile(r"(\w+)(?:\((.*)\))?", re.DOTALL)
+_BRACKET_FUNC_PATTERN = re.compile(r"(\w+)(?:\s*\((.*?)\))?", re.DOTALL)
+# All inline tool-call formats in one alternation so the content is scanned
+# once and calls come out in the order the model wrote them.
+_INLINE_TOOL_CALL_PATTERN = re.compile(
+    # <tool_call>...</tool_call> and Gemini-style <|tool_call>...<tool_call|>
+    r"(?P<tag>(?:<tool_call>|<\|tool_call\>)(?P<tag_body>.*?)(?:</tool_call>|<\|tool_call\|>|<tool_call\|>))"
+    # [TOOL_CALL]...[/TOOL_CALL]
+    r"|(?P<bracket>\[TOOL_CALL\]\s*(?P<bracket_body>.*?)\s*\[/TOOL_CALL\])"
+    # "Tool:" prefix (must be at start of text or after whitespace)
+    r"|(?P<prefix>(?:^|(?<=\s))Tool:\s+(?P<prefix_name>\w+)(?:\((?P<prefix_args>[^)]*)\))?)"
+    # <|channel|>commentary to=functions.NAME ... <|message|>JSON. The header
+    # tail stops at the next <|channel|> so a header without a message cannot
+    # scan to the end of the text (or borrow a later call's message).
+    r"|(?P<channel>(?:<\|start\|>assistant)?<\|channel\|>commentary to=functions\.(?P<channel_name>\w+)[^<]*(?:<(?!\|channel\|>|\|message\|>)[^<]*)*<\|message\|>(?P<channel_args>.*?)(?=<\||$))",
+    re.IGNORECASE | re.DOTALL,
+)
+_STREAM_TOOL_MARKERS = ("<tool_call", "<|tool_call", "[tool_call")
+_STREAM_TOOL_PREFIXES = frozenset({"tool:", "call:"})
+_INLINE_TOOL_CALL_SENTINELS = ("tool_call", "tool:", "commentary to=functions.")
+
+_ANALYSIS_SECTION_PATTERN = re.compile(
+    r"<\|channel\|>analysis<\|message\|>(?:[^<]++|<(?!\|end\|>))*+<\|end\|>"
+)
+# Literal marker; plain str.find is enough, no regex needed.
+_FINAL_CHANNEL_MARKER = "<|channel|>final<|message|>"
+
+_TOOL_CALL_STRIP_PATTERN = re.compile(
+    r"<tool_call>(?:[^<]++|<(?!/tool_call>))*+</tool_call>"
+)
+_GEMINI_TOOL_CALL_STRIP_PATTERN = re.compile(
+    r"<\|tool_call>(?:[^<]++|<(?!\|tool_call\|>|tool_call\|>))*+"
+    r"(?:<\|tool_call\|>|<tool_call\|>)"
+)
+_BRACKET_TOOL_CALL_STRIP_PATTERN = re.compile(
+    r"\[TOOL_CALL\](?:[^\[]++|\[(?!/TOOL_CALL\]))*+\[/TOOL_CALL\]"
+)
+_THINKING_BLOCK_PATTERN = re.compile(
+    r"<(thought|thinking|think)>((?:[^<]++|<(?!/\1>))*+)</\1>", re.IGNORECASE
+)
+
 
 def _parse_tool_argument_value(raw_value: str) -> Any:
     """Best-effort parse for tool argument values embedded in text formats."""
@@ -49,47 +144,33 @@ def _sanitize_visible_prose(content: str) -> str:
     if not content:
         return content
 
-    had_channel_marker = bool(re.search(r"<\|?channel", content, re.IGNORECASE))
-    had_leaked_thought_header = bool(
-        re.search(
-            r"<\|?channel\|?>\s*(thought|thinking|analysis|reasoning)\s*<\|?channel\|?>",
-            content,
-            re.IGNORECASE,
-        )
-    )
+    # Every reasoning/channel marker starts with "<"; plain prose only needs the
+    # standalone-marker-word check at the end.
+    if "<" not in content:
+        if content.strip().lower() in _STANDALONE_MARKER_WORDS:
+            return ""
+        return content
+
+    had_channel_marker = bool(_CHANNEL_MARKER_PATTERN.search(content))
+    had_leaked_thought_header = bool(_LEAKED_THOUGHT_HEADER_PATTERN.search(content))
 
     cleaned = content
 
     # Remove complete reasoning blocks in common channel formats.
-    cleaned = re.sub(
-        r"<\|channel\|>\s*(analysis|thinking|thought|reasoning)\s*<\|message\|>.*?(?=(<\|channel\|>\s*final\s*<\|message\|>|$))",
-        "",
-        cleaned,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    cleaned = _REASONING_BLOCK_PATTERN.sub("", cleaned)
 
     # Remove malformed channel headers like <|channel>thought<channel|>.
-    cleaned = re.sub(
-        r"<\|?channel\|?>\s*(?:analysis|thought|thinking|reasoning|final)\s*<\|?channel\|?>",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _MALFORMED_CHANNEL_HEADER_PATTERN.sub("", cleaned)
 
     # Remove inline thought/thinking sections (closed and unclosed).
-    cleaned = re.sub(
-        r"<(thought|thinking|think)>.*?</\1>",
-        "",
-        cleaned,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    cleaned = re.sub(r"<(thought|thinking|think)>.*$", "", cleaned, flags=re.IGNORECASE)
+    cleaned = _CLOSED_THOUGHT_PATTERN.sub("", cleaned)
+    cleaned = _UNCLOSED_THOUGHT_PATTERN.sub("", cleaned)
 
     # Remove channel protocol tokens, keep actual prose.
-    cleaned = re.sub(r"<\|?channel\|?>", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"<\|?message\|?>", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"<\|?start\|?>assistant", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"<\|?end\|?>", "", cleaned, flags=re.IGNORECASE)
+    cleaned = _CHANNEL_TOKEN_PATTERN.sub("", cleaned)
+    cleaned = _MESSAGE_TOKEN_PATTERN.sub("", cleaned)
+    cleaned = _START_ASSISTANT_TOKEN_PATTERN.sub("", cleaned)
+    cleaned = _END_TOKEN_PATTERN.sub("", cleaned)
 
     if had_leaked_thought_header:
         boundary = cleaned.find("\n\n")
@@ -100,59 +181,36 @@ def _sanitize_visible_prose(content: str) -> str:
 
     # If a marker label still leaks at the beginning, drop it and any following
     # line noise until paragraph boundary when available.
-    prefix_match = re.match(
-        r"^\s*(thought|thinking|analysis|reasoning|final)\b", cleaned, re.IGNORECASE
-    )
+    prefix_match = _MARKER_LABEL_PREFIX_PATTERN.match(cleaned)
     if prefix_match and had_channel_marker:
         boundary = cleaned.find("\n\n")
         if boundary >= 0:
             cleaned = cleaned[boundary + 2 :]
         else:
-            cleaned = re.sub(
-                r"^\s*(thought|thinking|analysis|reasoning|final)\s*",
-                "",
-                cleaned,
-                flags=re.IGNORECASE,
-            )
+            cleaned = _MARKER_LABEL_STRIP_PATTERN.sub("", cleaned)
 
     # Drop standalone marker words left behind after token cleanup.
-    if cleaned.strip().lower() in {
-        "thought",
-        "thinking",
-        "think",
-        "analysis",
-        "reasoning",
-        "final",
-    }:
+    if cleaned.strip().lower() in _STANDALONE_MARKER_WORDS:
         return ""
     return cleaned
 
 
 def _is_reasoning_channel(channel: str) -> bool:
     """Return True when channel name represents reasoning/thinking content."""
-    value = (channel or "").strip().lower()
-    return value in {"thinking", "thought", "analysis", "reasoning"}
+    if channel in _REASONING_CHANNELS:
+        return True
+    return (channel or "").strip().lower() in _REASONING_CHANNELS
 
 
 def _parse_xml_style_tool_call(content_inner: str) -> tuple[str, dict[str, Any]] | None:
     """Parse legacy XML-like tool call bodies with optional parameter tags."""
-    xml_match = re.search(
-        r"<function=(\w+)>(.*?)</function>",
-        content_inner,
-        re.IGNORECASE | re.DOTALL,
-    )
+    xml_match = _XML_FUNCTION_PATTERN.search(content_inner)
     if not xml_match:
         return None
 
     name = xml_match.group(1)
     function_body = (xml_match.group(2) or "").strip()
-    param_matches = list(
-        re.finditer(
-            r"<parameter=([^>\s]+)>(.*?)</parameter>",
-            function_body,
-            re.IGNORECASE | re.DOTALL,
-        )
-    )
+    param_matches = list(_XML_PARAMETER_PATTERN.finditer(function_body))
     if param_matches:
         args_obj: dict[str, Any] = {}
         for param_match in param_matches:
@@ -170,8 +228,10 @@ def _parse_xml_style_tool_call(content_inner: str) -> tuple[str, dict[str, Any]]
                 args_obj[param_name] = param_value
         return name, args_obj
 
+    if not function_body:
+        return name, {}
     try:
-        args_obj = try_parse_json_robust(function_body or "{}")
+        args_obj = try_parse_json_robust(function_body)
         if not isinstance(args_obj, dict):
             args_obj = {}
     except Exception:
@@ -179,209 +239,139 @@ def _parse_xml_style_tool_call(content_inner: str) -> tuple[str, dict[str, Any]]
     return name, args_obj
 
 
-def parse_tool_calls_from_content(content: str) -> list[dict] | None:
-    """Parse tool calls from assistant content if not provided in structured format.
+def _arguments_json(args_str: str, *, robust: bool = True) -> str:
+    """Return a JSON arguments string for text-embedded tool-call arguments.
 
-    Handles various formats like:
-    - <tool_call>get_project_overview</tool_call>
-    - <tool_call><function=get_project_overview></function></tool_call>
-    - [TOOL_CALL]get_project_overview[/TOOL_CALL]
-    - Tool: get_project_overview
+    Text that already is valid JSON is passed through as-is instead of being
+    parsed and re-serialized. Otherwise the quote-repairing parser is tried
+    when ``robust`` is set, and ``"{}"`` is the final fallback.
     """
+    text = args_str.strip()
+    if text == _EMPTY_ARGS_JSON:
+        return _EMPTY_ARGS_JSON
+    try:
+        _json.loads(text)
+        return text
+    except ValueError:
+        pass
+    if robust:
+        try:
+            return _json.dumps(try_parse_json_robust(text))
+        except Exception:
+            pass
+    return _EMPTY_ARGS_JSON
 
-    calls = []
-
-    # 1. Look for <tool_call> tags and Gemini-style <|tool_call|> wrappers
-    pattern1 = r"(?:<tool_call>|<\|tool_call\>)(.*?)(?:</tool_call>|<\|tool_call\|>|<tool_call\|>)"
-    matches1 = re.finditer(pattern1, content, re.IGNORECASE | re.DOTALL)
-
-    for m in matches1:
-        content_inner = m.group(1).strip()
 
-        # Try JSON format: {"name": "...", "arguments": ...}
-        if content_inner.startswith("{"):
+def _parse_tagged_tool_call(content_inner: str) -> tuple[str, str] | None:
+    """Parse the body of a <tool_call> wrapper into a name and JSON arguments."""
+    # Try JSON format: {"name": "...", "arguments": ...}
+    if content_inner.startswith("{"):
+        try:
+            json_obj = try_parse_json_robust(content_inner)
+            if isinstance(json_obj, dict) and "name" in json_obj:
+                if "arguments" not in json_obj:
+                    return json_obj["name"], _EMPTY_ARGS_JSON
+                return json_obj["name"], _json.dumps(json_obj["arguments"])
+        except Exception:
+            pass
+
+    # Try XML-like format: <function=NAME>ARGS</function>
+    xml_call = _parse_xml_style_tool_call(content_inner)
+    if xml_call:
+        xml_name, xml_args = xml_call
+        return xml_name, _json.dumps(xml_args) if xml_args else _EMPTY_ARGS_JSON
+
+    # Try call:NAME{ARGS} format
+    normalized_content = _normalize_gemini_tokens(content_inner)
+    call_match = _CALL_COLON_PATTERN.match(normalized_content)
+    if call_match:
+        name = call_match.group(1)
+        args_str = call_match.group(2).strip()
+        if not args_str:
+            return name, _EMPTY_ARGS_JSON
+        args_obj: Any = {}
+        try:
+            args_obj = try_parse_json_robust(f"{{{args_str}}}")
+            if not isinstance(args_obj, dict):
+                args_obj = {}
+        except Exception:
             try:
-                json_obj = try_parse_json_robust(content_inner)
-                if isinstance(json_obj, dict) and "name" in json_obj:
-                    name = json_obj["name"]
-                    args_obj = json_obj.get("arguments", {})
-
-                    call_id = f"call_{name}"
-                    if any(c["id"] == call_id for c in calls):
-                        call_id = f"{call_id}_{len(calls)}"
-
-                    calls.append(
-                        {
-                            "id": call_id,
-                            "type": "function",
-                            "function": {
-                                "name": name,
-                                "arguments": _json.dumps(args_obj),
-                            },
-                            "original_text": m.group(0),
-                        }
-                    )
-                    continue
+                quoted_args = _UNQUOTED_KEY_PATTERN.sub(r'"\1":', args_str)
+                args_obj = try_parse_json_robust(f"{{{quoted_args}}}")
+                if not isinstance(args_obj, dict):
+                    args_obj = {}
             except Exception:
-                pass
-
-        # Try XML-like format: <function=NAME>ARGS</function>
-        xml_call = _parse_xml_style_tool_call(content_inner)
-        if xml_call:
-            name, args_obj = xml_call
-
-            call_id = f"call_{name}"
-            # Ensure unique ID if multiple calls to same tool
-            if any(c["id"] == call_id for c in calls):
-                call_id = f"{call_id}_{len(calls)}"
-
-            calls.append(
-                {
-                    "id": call_id,
-                    "type": "function",
-                    "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                    "original_text": m.group(0),
-                }
-            )
-            continue
+                args_obj = {}
+        return name, _json.dumps(args_obj) if args_obj else _EMPTY_ARGS_JSON
 
-        # Try call:NAME{ARGS} format
-        normalized_content = _normalize_gemini_tokens(content_inner)
-        call_match = re.match(
-            r"^call:(\w+)\s*\{(.*)\}\s*$", normalized_content, re.DOTALL
-        )
-        if call_match:
-            name = call_match.group(1)
-            args_str = call_match.group(2).strip()
-            args_obj: dict[str, Any] = {}
-            if args_str:
-                try:
-                    args_obj = try_parse_json_robust(f"{{{args_str}}}")
-                    if not isinstance(args_obj, dict):
-                        args_obj = {}
-                except Exception:
-                    try:
-                        quoted_args = re.sub(r"([A-Za-z0-9_]+)\s*:", r'"\1":', args_str)
-                        args_obj = try_parse_json_robust(f"{{{quoted_args}}}")
-                        if not isinstance(args_obj, dict):
-                            args_obj = {}
-                    except Exception:
-                        args_obj = {}
-
-            call_id = f"call_{name}"
-            if any(c["id"] == call_id for c in calls):
-                call_id = f"{call_id}_{len(calls)}"
-
-            calls.append(
-                {
-                    "id": call_id,
-                    "type": "function",
-                    "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                    "original_text": m.group(0),
-                }
-            )
-            continue
+    # Try NAME(ARGS) format
+    func_match = _FUNC_PAREN_PATTERN.match(content_inner)
+    if func_match:
+        args_str = func_match.group(2) or _EMPTY_ARGS_JSON
+        return func_match.group(1), _arguments_json(args_str, robust=False)
+    return None
 
-        # Try NAME(ARGS) format
-        func_match = re.match(r"(\w+)(?:\((.*)\))?", content_inner, re.DOTALL)
-        if func_match:
-            name = func_match.group(1)
-            args_str = func_match.group(2) or "{}"
-            try:
-                args_obj = _json.loads(args_str)
-            except Exception:
-                args_obj = {}
 
-            call_id = f"call_{name}"
-            if any(c["id"] == call_id for c in calls):
-                call_id = f"{call_id}_{len(calls)}"
-
-            calls.append(
-                {
-                    "id": call_id,
-                    "type": "function",
-                    "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                    "original_text": m.group(0),
-                }
-            )
-
-    # 2. Look for [TOOL_CALL] tags
-    pattern2 = r"\[TOOL_CALL\]\s*(.*?)\s*\[/TOOL_CALL\]"
-    matches2 = re.finditer(pattern2, content, re.IGNORECASE | re.DOTALL)
-
-    for m in matches2:
-        content_inner = m.group(1).strip()
-        func_match = re.match(r"(\w+)(?:\s*\((.*?)\))?", content_inner, re.DOTALL)
-        if func_match:
-            name = func_match.group(1)
-            args_str = func_match.group(2).strip() if func_match.group(2) else "{}"
-            try:
-                args_obj = try_parse_json_robust(args_str)
-            except Exception:
-                args_obj = {}
+def _parse_inline_tool_call(m: re.Match[str]) -> tuple[str, str] | None:
+    """Turn one _INLINE_TOOL_CALL_PATTERN match into a name and JSON arguments."""
+    kind = m.lastgroup
+    if kind == "tag":
+        return _parse_tagged_tool_call(m.group("tag_body").strip())
 
-            call_id = f"call_{name}"
-            if any(c["id"] == call_id for c in calls):
-                call_id = f"{call_id}_{len(calls)}"
-
-            calls.append(
-                {
-                    "id": call_id,
-                    "type": "function",
-                    "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                    "original_text": m.group(0),
-                }
-            )
-
-    # 3. Look for "Tool:" prefix (must be at start of line or after whitespace)
-    pattern3 = r"(?:^|(?<=\s))Tool:\s+(\w+)(?:\(([^)]*)\))?"
-    matches3 = re.finditer(pattern3, content, re.IGNORECASE)
-
-    for m in matches3:
-        name = m.group(1)
-        args_str = m.group(2).strip() if m.group(2) else "{}"
-        try:
-            args_obj = try_parse_json_robust(args_str) if args_str != "{}" else {}
-        except Exception:
-            args_obj = {}
+    if kind == "bracket":
+        func_match = _BRACKET_FUNC_PATTERN.match(m.group("bracket_body").strip())
+        if not func_match:
+            return None
+        args_str = func_match.group(2) or _EMPTY_ARGS_JSON
+        return func_match.group(1), _arguments_json(args_str)
 
-        call_id = f"call_{name}"
-        if any(c["id"] == call_id for c in calls):
-            call_id = f"{call_id}_{len(calls)}"
+    if kind == "prefix":
+        raw_args = m.group("prefix_args")
+        args_str = raw_args or _EMPTY_ARGS_JSON
+        return m.group("prefix_name"), _arguments_json(args_str)
 
-        calls.append(
-            {
-                "id": call_id,
-                "type": "function",
-                "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                "original_text": m.group(0),
-            }
-        )
+    args_str = m.group("channel_args").strip() or _EMPTY_ARGS_JSON
+    return m.group("channel_name"), _arguments_json(args_str)
 
-    # 4. Look for <|channel|>commentary to=functions.NAME ... <|message|>JSON
-    pattern4 = r"(?:<\|start\|>assistant)?<\|channel\|>commentary to=functions\.(\w+).*?<\|message\|>(.*?)(?=<\||$)"
-    matches4 = re.finditer(pattern4, content, re.IGNORECASE | re.DOTALL)
 
-    for m in matches4:
-        name = m.group(1)
-        args_str = m.group(2).strip() or "{}"
-        try:
-            args_obj = try_parse_json_robust(args_str)
-        except Exception:
-            args_obj = {}
+def parse_tool_calls_from_content(
+    content: str, include_original_text: bool = False
+) -> list[dict] | None:
+    """Parse tool calls from assistant content if not provided in structured format.
+
+    Handles various formats like:
+    - <tool_call>get_project_overview</tool_call>
+    - <tool_call><function=get_project_overview></function></tool_call>
+    - [TOOL_CALL]get_project_overview[/TOOL_CALL]
+    - Tool: get_project_overview
 
+    With ``include_original_text`` each call also carries the markup it was
+    parsed from under ``"original_text"``.
+    """
+    # Cheap substring gate lets plain prose skip the regex scan entirely.
+    lowered = content.lower()
+    if not any(sentinel in lowered for sentinel in _INLINE_TOOL_CALL_SENTINELS):
+        return None
+
+    calls: list[dict] = []
+    seen_ids: set[str] = set()
+    for m in _INLINE_TOOL_CALL_PATTERN.finditer(content):
+        parsed = _parse_inline_tool_call(m)
+        if parsed is None:
+            continue
+        name, arguments = parsed
         call_id = f"call_{name}"
-        if any(c["id"] == call_id for c in calls):
+        if call_id in seen_ids:
             call_id = f"{call_id}_{len(calls)}"
-
-        calls.append(
-            {
-                "id": call_id,
-                "type": "function",
-                "function": {"name": name, "arguments": _json.dumps(args_obj)},
-                "original_text": m.group(0),
-            }
-        )
+        seen_ids.add(call_id)
+        call: dict[str, Any] = {
+            "id": call_id,
+            "type": "function",
+            "function": {"name": name, "arguments": arguments},
+        }
+        if include_original_text:
+            call["original_text"] = m.group(0)
+        calls.append(call)
 
     return calls if calls else None
 
@@ -394,22 +384,12 @@ def strip_thinking_tags(content: str) -> str:
     # Handle <|channel|>analysis<|message|>...<|end|><|start|>assistant<|channel|>final<|message|>
     if "<|channel|>analysis<|message|>" in content:
         # Try to find the final channel
-        final_match = re.search(
-            r"<\|channel\|>final<\|message\|>(.*)", content, re.DOTALL
-        )
-        if final_match:
-            return final_match.group(1).strip()
+        final_start = content.find(_FINAL_CHANNEL_MARKER)
+        if final_start >= 0:
+            return content[final_start + len(_FINAL_CHANNEL_MARKER) :].strip()
         # Fall back to stripping analysis sections when the stream terminates
         # before a final channel block is emitted.
-        content = re.sub(
-            r"<\|channel\|>analysis<\|message\|>.*?<\|end\|>",
-            "",
-            content,
-            flags=re.DOTALL,
-        )
-        content = re.sub(
-            r"<\|start\|>assistant<\|channel\|>final<\|message\|>", "", content
-        )
+        content = _ANALYSIS_SECTION_PATTERN.sub("", content)
         return content.strip()
 
     content = _sanitize_visible_prose(content)
@@ -421,32 +401,25 @@ def strip_tool_call_tags(content: str) -> str:
     """Strip inline tool-call markup from assistant content."""
     if not content:
         return content
-    content = re.sub(r"<tool_call>.*?</tool_call>", "", content, flags=re.DOTALL)
-    content = re.sub(
-        r"<\|tool_call\>.*?(?:<\|tool_call\|>|<tool_call\|>)",
-        "",
-        content,
-        flags=re.DOTALL,
-    )
-    content = re.sub(
-        r"\[TOOL_CALL\]\s*.*?\s*\[/TOOL_CALL\]",
-        "",
-        content,
-        flags=re.DOTALL,
-    )
+    # Each strip needs both its opener and a closer; without a closer nothing
+    # can match, so skip the scan entirely.
+    if "<tool_call>" in content and "</tool_call>" in content:
+        content = _TOOL_CALL_STRIP_PATTERN.sub("", content)
+    if "<|tool_call>" in content and (
+        "<|tool_call|>" in content or "<tool_call|>" in content
+    ):
+        content = _GEMINI_TOOL_CALL_STRIP_PATTERN.sub("", content)
+    if "[TOOL_CALL]" in content and "[/TOOL_CALL]" in content:
+        content = _BRACKET_TOOL_CALL_STRIP_PATTERN.sub("", content)
     return content.strip()
 
 
 def extract_thinking_from_content(content: str) -> str:
     """Extract first thinking/thought block content from assistant text."""
-    if not content:
+    if not content or "<" not in content:
         return ""
 
-    match = re.search(
-        r"<(thought|thinking|think)>(.*?)</\1>",
-        content,
-        re.DOTALL | re.IGNORECASE,
-    )
+    match = _THINKING_BLOCK_PATTERN.search(content)
     if not match:
         return ""
     return (match.group(2) or "").strip()
@@ -456,13 +429,21 @@ def parse_complete_assistant_output(
     content: str,
     structured_tool_calls: list[dict] | None = None,
     extra_tool_call_content: str = "",
+    include_original_text: bool = False,
 ) -> dict[str, Any]:
     """Parse complete assistant output into normalized content/tool_calls/thinking."""
     tool_calls = list(structured_tool_calls or [])
-    parsed_calls = parse_tool_calls_from_content(content or "") or []
+    parsed_calls = (
+        parse_tool_calls_from_content(content or "", include_original_text) or []
+    )
     if parsed_calls:
         tool_calls.extend(parsed_calls)
-    extra_calls = parse_tool_calls_from_content(extra_tool_call_content or "") or []
+    extra_calls = (
+        parse_tool_calls_from_content(
+            extra_tool_call_content or "", include_original_text
+        )
+        or []
+    )
     if extra_calls:
         tool_calls.extend(extra_calls)
 
@@ -483,12 +464,28 @@ def normalize_tool_channel_name(name: str) -> str:
     return cleaned
 
 
+# Channel names that carry a tool invocation, e.g. "commentary to=functions.x"
+# or "call:x"; the function name follows the prefix.
+_TOOL_CHANNEL_PREFIXES = ("commentary to=", "call:")
+
+
+def _tool_channel_prefix(channel: str) -> str | None:
+    """Return the tool-invocation prefix ``channel`` starts with, if any."""
+    for prefix in _TOOL_CHANNEL_PREFIXES:
+        if channel.startswith(prefix):
+            return prefix
+    return None
+
+
 def parse_stream_channel_fragments(
     fragments: list[dict[str, str]],
     sent_tool_call_ids: set[str] | None = None,
-) -> list[dict[str, Any]]:
-    """Convert ChannelFilter fragments to normalized stream events."""
-    events: list[dict[str, Any]] = []
+) -> Iterator[dict[str, Any]]:
+    """Convert ChannelFilter fragments to normalized stream events.
+
+    Events are yielded as they are produced so the caller can forward each one
+    to the client without waiting for the whole batch.
+    """
     seen_ids = sent_tool_call_ids if sent_tool_call_ids is not None else set()
 
     for fragment in fragments:
@@ -499,63 +496,38 @@ def parse_stream_channel_fragments(
 
         if _is_reasoning_channel(channel):
             if piece:
-                events.append({"thinking": piece})
+                yield {"thinking": piece}
             continue
 
-        if channel.startswith("commentary to="):
-            func_name = normalize_tool_channel_name(
-                channel.split("commentary to=", 1)[1].strip()
-            )
+        tool_channel_prefix = _tool_channel_prefix(channel)
+        if tool_channel_prefix is not None:
+            func_name = normalize_tool_channel_name(channel[len(tool_channel_prefix) :])
             if not func_name:
                 continue
             call_id = f"call_{func_name}"
             if call_id in seen_ids:
                 continue
             seen_ids.add(call_id)
-            events.append(
-                {
-                    "tool_calls": [
-                        {
-                            "id": call_id,
-                            "type": "function",
-                            "function": {"name": func_name, "arguments": piece},
-                        }
-                    ]
-                }
-            )
-            continue
-
-        if channel.startswith("call:"):
-            func_name = normalize_tool_channel_name(channel[5:])
-            if not func_name:
-                continue
-            call_id = f"call_{func_name}"
-            if call_id in seen_ids:
-                continue
-            seen_ids.add(call_id)
-            events.append(
-                {
-                    "tool_calls": [
-                        {
-                            "id": call_id,
-                            "type": "function",
-                            "function": {"name": func_name, "arguments": piece},
-                        }
-                    ]
-                }
-            )
+            yield {
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": func_name, "arguments": piece},
+                    }
+                ]
+            }
             continue
 
         if channel == "tool_def":
             continue
 
-        piece_lower = piece.lower()
-        has_tool_syntax = (
-            "<tool_call" in piece_lower
-            or "<|tool_call" in piece_lower
-            or "[tool_call" in piece_lower
-            or piece_lower.strip().startswith("tool:")
-            or piece_lower.strip().startswith("call:")
+        # Most fragments are a few characters of prose: check the leading
+        # keyword without lowercasing the whole piece, and only lowercase for
+        # the tag markers when a "<" or "[" is present at all.
+        has_tool_syntax = piece.lstrip()[:5].lower() in _STREAM_TOOL_PREFIXES or (
+            ("<" in piece or "[" in piece)
+            and any(marker in piece.lower() for marker in _STREAM_TOOL_MARKERS)
         )
         if has_tool_syntax:
             parsed_calls = parse_tool_calls_from_content(piece) or []
@@ -566,7 +538,7 @@ def parse_stream_channel_fragments(
                         call_id = call.get("id")
                         if isinstance(call_id, str):
                             seen_ids.add(call_id)
-                    events.append({"tool_calls": new_calls})
+                    yield {"tool_calls": new_calls}
                 continue
 
         cleaned_piece = _sanitize_visible_prose(piece)
@@ -579,6 +551,4 @@ def parse_stream_channel_fragments(
             "analysis",
         }:
             continue
-        events.append({"content": cleaned_piece})
-
-    return events
+        yield {"content": cleaned_piece}
@@ -21,7 +21,43 @@ from augmentedquill.services.llm.llm_http_ops import logged_request
 # 1x1 transparent pixel
 PIXEL_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
 
+# Probe request bodies minus the model id. They never change, so they are
+# built once instead of per probe; logged_request serializes them as-is.
+_VISION_PROBE_BODY: dict[str, Any] = {
+    "messages": [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "."},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/png;base64,{PIXEL_B64}"},
+                },
+            ],
+        }
+    ],
+    "max_tokens": 1,
+}
+_FUNCTION_CALLING_PROBE_BODY: dict[str, Any] = {
+    "messages": [{"role": "user", "content": "func"}],
+    "tools": [
+        {
+            "type": "function",
+            "function": {
+                "name": "test_func",
+                "description": "test function",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+    ],
+    "tool_choice": "auto",
+    "max_tokens": 1,
+}
+
 _CAPABILITY_CACHE_TTL_S = 3600
+_PROBE_CONNECT_TIMEOUT_S = 5.0
+# Errors meaning the provider endpoint cannot be reached at all.
+_PROBE_UNREACHABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
 _capability_cache: dict[tuple[str, str, str], tuple[float, dict]] = {}
 _capability_inflight: dict[tuple[str, str, str], asyncio.Task] = {}
 _capability_lock = asyncio.Lock()
@@ -45,84 +81,61 @@ async def _probe_model_capabilities(
     url = str(base_url or "").strip().rstrip("/") + "/chat/completions"
     headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
     headers["Content-Type"] = "application/json"
+    read_timeout = float(timeout_s or 10)
+    # A provider that cannot even accept a connection is reported quickly
+    # instead of after the full read timeout.
+    timeout = httpx.Timeout(
+        read_timeout, connect=min(_PROBE_CONNECT_TIMEOUT_S, read_timeout)
+    )
 
     async def check_vision() -> Any:
         """Check Vision."""
         try:
-            payload = {
-                "model": model_id,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": "."},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:image/png;base64,{PIXEL_B64}"
-                                },
-                            },
-                        ],
-                    }
-                ],
-                "max_tokens": 1,
-            }
+            payload = {"model": model_id, **_VISION_PROBE_BODY}
             response = await logged_request(
                 caller_id="llm_utils.probe_model_capabilities.check_vision",
                 method="POST",
                 url=url,
                 headers=headers,
-                timeout=httpx.Timeout(float(timeout_s or 10)),
+                timeout=timeout,
                 body=payload,
                 raise_for_status=False,
             )
             return response.status_code == 200
+        except _PROBE_UNREACHABLE_ERRORS:
+            raise
         except Exception:
             return False
 
     async def check_function_calling() -> Any:
         """Check Function Calling."""
         try:
-            payload = {
-                "model": model_id,
-                "messages": [{"role": "user", "content": "func"}],
-                "tools": [
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "test_func",
-                            "description": "test function",
-                            "parameters": {"type": "object", "properties": {}},
-                        },
-                    }
-                ],
-                "tool_choice": "auto",
-                "max_tokens": 1,
-            }
+            payload = {"model": model_id, **_FUNCTION_CALLING_PROBE_BODY}
             response = await logged_request(
                 caller_id="llm_utils.probe_model_capabilities.check_function_calling",
                 method="POST",
                 url=url,
                 headers=headers,
-                timeout=httpx.Timeout(float(timeout_s or 10)),
+                timeout=timeout,
                 body=payload,
                 raise_for_status=False,
             )
             return response.status_code == 200
+        except _PROBE_UNREACHABLE_ERRORS:
+            raise
         except Exception:
             return False
 
+    # The probes hit the same endpoint: once one of them cannot connect the
+    # other cannot succeed either, so the task group cancels it.
     try:
-        results = await asyncio.gather(
-            check_vision(),
-            check_function_calling(),
-            return_exceptions=True,
-        )
-    except Exception:
-        results = [False, False]
-
-    is_multimodal = results[0] if isinstance(results[0], bool) else False
-    supports_function_calling = results[1] if isinstance(results[1], bool) else False
+        async with asyncio.TaskGroup() as group:
+            vision_task = group.create_task(check_vision())
+            function_calling_task = group.create_task(check_function_calling())
+        is_multimodal = vision_task.result() is True
+        supports_function_calling = function_calling_task.result() is True
+    except* _PROBE_UNREACHABLE_ERRORS:
+        is_multimodal = supports_function_calling = False
 
     return {
         "is_multimodal": is_multimodal,
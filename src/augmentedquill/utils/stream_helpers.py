@@ -11,9 +11,150 @@ Utility functions for handling server-sent events (SSE) and data streaming.
 Includes stateful filtering for multi-channel LLM output.
 """
 
-import re
 from typing import List, Dict
 
+# Fixed control tags (lowercase) and the channel each one switches to. Tags
+# are matched case-insensitively against a lowered window at the candidate
+# position, once per distinct tag length; no tag is a prefix of another, so at
+# most one matches.
+_LITERAL_TAG_CHANNELS: dict[str, str] = {
+    "<|end|>": "final",
+    "<|tool_call>": "tool_def",
+    "<|tool_call|>": "final",
+    "<tool_call|>": "final",
+    "<thought>": "thought",
+    "<thinking>": "thought",
+    "</thought>": "final",
+    "</thinking>": "final",
+    "<tool_call>": "tool_def",
+    "</tool_call>": "final",
+    "[tool_call]": "tool_def",
+    "[/tool_call]": "final",
+}
+_LITERAL_TAG_LENGTHS = sorted({len(tag) for tag in _LITERAL_TAG_CHANNELS})
+# Every tag continues its "<" or "[" with one of these characters, which lets
+# ordinary brackets in prose ("<i>", "[sic]") be rejected with one lookup.
+_TAG_SECOND_CHARS = frozenset("|/tT")
+
+# Longest stretch of unmatched text kept waiting for a tag to complete. It
+# leaves room for channel headers, whose names have no fixed length.
+_MAX_PENDING_TAG_LEN = 150
+
+_CHANNEL_HEADER = "<|channel|>"
+_ASSISTANT_HEADER = "<|start|>assistant"
+_MESSAGE_TOKEN = "<|message|>"
+
+
+def _find_ci(text: str, token: str, start: int = 0) -> int:
+    """Return the index of lowercase ``token`` in ``text`` ignoring case, or -1."""
+    size = len(token)
+    idx = text.find(token[0], start)
+    while idx != -1:
+        if text[idx : idx + size].lower() == token:
+            return idx
+        idx = text.find(token[0], idx + 1)
+    return -1
+
+
+def _channel_name(text: str, start: int, end: int) -> str:
+    """Return the channel name in ``text[start:end]`` minus any ``<|constrain|>`` part.
+
+    Works on bounds into the original text so a header costs one bounded find
+    and one slice instead of a chain of splits.
+    """
+    constrain_idx = text.find("<|constrain|>", start, end)
+    if constrain_idx != -1:
+        end = constrain_idx
+    return text[start:end].strip()
+
+
+def _assistant_header_channel(tag_text: str) -> str | None:
+    """Return the channel a ``<|start|>assistant...<|message|>`` header selects."""
+    channel_idx = tag_text.find(_CHANNEL_HEADER)
+    if tag_text.startswith(_ASSISTANT_HEADER) and channel_idx != -1:
+        name_start = channel_idx + len(_CHANNEL_HEADER)
+        name_end = tag_text.find(_MESSAGE_TOKEN, name_start)
+        if name_end == -1:
+            name_end = len(tag_text)
+        return _channel_name(tag_text, name_start, name_end)
+    if _MESSAGE_TOKEN in tag_text:
+        # Message boundaries without explicit channel changes do not require
+        # state transitions.
+        return None
+    if "<|end|>" in tag_text:
+        return "final"
+    return None
+
+
+def _find_tag(buffer: str, pos: int = 0) -> tuple[int, int, str | None] | None:
+    """Locate the first complete control tag in ``buffer`` at or after ``pos``.
+
+    Only ``<`` and ``[`` positions can start a tag, so the scan jumps between
+    them with ``str.find``. Returns ``(start, end, channel)`` where ``channel``
+    is the channel the tag switches to, or None when the tag keeps the current
+    channel; returns None when no complete tag is buffered yet.
+    """
+    # Index of the next <|message|> at or after the last header searched: -2
+    # before the first search, -1 once it is known that none follows.
+    message_idx = -2
+    next_lt = buffer.find("<", pos)
+    next_lb = buffer.find("[", pos)
+    while next_lt != -1 or next_lb != -1:
+        if next_lb == -1 or (next_lt != -1 and next_lt < next_lb):
+            idx = next_lt
+            next_lt = buffer.find("<", idx + 1)
+        else:
+            idx = next_lb
+            next_lb = buffer.find("[", idx + 1)
+
+        if buffer[idx + 1 : idx + 2] not in _TAG_SECOND_CHARS:
+            continue
+        window = buffer[idx : idx + len(_ASSISTANT_HEADER)].lower()
+        for length in _LITERAL_TAG_LENGTHS:
+            tag = window[:length]
+            channel = _LITERAL_TAG_CHANNELS.get(tag)
+            if channel is None:
+                continue
+            start, end = idx, idx + length
+            if tag == "[tool_call]":
+                while end < len(buffer) and buffer[end].isspace():
+                    end += 1
+            elif tag == "[/tool_call]":
+                while start > pos and buffer[start - 1].isspace():
+                    start -= 1
+            return start, end, channel
+
+        if window.startswith(_CHANNEL_HEADER):
+            body_start = idx + len(_CHANNEL_HEADER)
+        elif window == _ASSISTANT_HEADER:
+            body_start = idx + len(_ASSISTANT_HEADER)
+        else:
+            continue
+        if message_idx == -2 or (message_idx != -1 and message_idx < body_start):
+            message_idx = _find_ci(buffer, _MESSAGE_TOKEN, body_start)
+        if message_idx == -1:
+            continue
+        end = message_idx + len(_MESSAGE_TOKEN)
+        if window == _ASSISTANT_HEADER:
+            return idx, end, _assistant_header_channel(buffer[idx:end])
+        if message_idx == body_start:
+            return idx, end, None
+        return idx, end, _channel_name(buffer, body_start, message_idx)
+    return None
+
+
+def _append_segment(results: List[Dict[str, str]], channel: str, content: str) -> None:
+    """Append ``content`` to ``results``, merging it into a same-channel tail.
+
+    Tags that keep the channel (``<|message|>``, repeated openers) would
+    otherwise split one run of text into several fragments, each of which the
+    caller parses and sends as its own event.
+    """
+    if results and results[-1]["channel"] == channel:
+        results[-1]["content"] += content
+    else:
+        results.append({"channel": channel, "content": content})
+
 
 class ChannelFilter:
     """Stateful filter to separate thinking/analysis from final content."""
@@ -22,48 +163,48 @@ class ChannelFilter:
         """Init  ."""
         self.current_channel = "final"
         self.buffer = ""
-        # Combined pattern for all tags we care about
-        self.tag_pattern = re.compile(
-            r"(<\|channel\|>(.*?)<\|message\|>|"
-            r"<\|start\|>assistant.*?<\|message\|>|"
-            r"<\|end\|>|"
-            r"<\|tool_call\>|"
-            r"<\|tool_call\|>|"
-            r"<tool_call\|>|"
-            r"<(thought|thinking)>|"
-            r"</(thought|thinking)>|"
-            r"\[TOOL_CALL\]\s*|"
-            r"\s*\[/TOOL_CALL\]|"
-            r"<tool_call>|"
-            r"</tool_call>)",
-            re.IGNORECASE | re.DOTALL,
-        )
+        # Where to resume looking for the closer of a malformed channel header
+        # the buffer is waiting on; the header is unbounded, so rescanning it
+        # from the start on every chunk would be quadratic.
+        self._header_scan_from = 0
 
     def feed(self, chunk: str) -> List[Dict[str, str]]:
         """Process a chunk and return a list of (channel, content) pairs."""
-        self.buffer += chunk
+        buffer = self.buffer + chunk
+        # Most streamed chunks are plain prose: with no "<" or "[" there can be
+        # no tag, complete or partial, so the whole buffer is emitted as-is.
+        if "<" not in buffer and "[" not in buffer:
+            self.buffer = ""
+            if not buffer:
+                return []
+            return [{"channel": self.current_channel, "content": buffer}]
+
         results = []
+        # Read offset into ``buffer``; consumed text is dropped with a single
+        # slice at the end instead of re-copying the tail after every tag.
+        pos = 0
 
         while True:
             # Fast-path malformed paired channel headers like:
             # <|channel>thought\n<channel|>
-            lower_buf = self.buffer.lower()
-            if lower_buf.startswith("<|channel>"):
-                opener = "<|channel>"
-                start_idx = len(opener)
-                close_idx = lower_buf.find("<channel|>", start_idx)
+            if buffer[pos : pos + 10].lower() == "<|channel>":
+                start_idx = pos + 10
+                scan_from = max(start_idx, pos + self._header_scan_from)
                 close_token = "<channel|>"
+                close_idx = _find_ci(buffer, close_token, scan_from)
                 if close_idx == -1:
-                    close_idx = lower_buf.find("<|channel>", start_idx)
                     close_token = "<|channel>"
+                    close_idx = _find_ci(buffer, close_token, scan_from)
 
                 if close_idx == -1:
+                    # Only a closer split by the chunk boundary can still
+                    # start within the last len(close_token) - 1 characters.
+                    self._header_scan_from = len(buffer) - pos - len(close_token) + 1
                     break
+                self._header_scan_from = 0
 
-                channel_name = self.buffer[start_idx:close_idx]
-                if "<|constrain|>" in channel_name:
-                    channel_name = channel_name.split("<|constrain|>", 1)[0]
-                normalized = channel_name.strip().lower()
+                channel_name = _channel_name(buffer, start_idx, close_idx)
+                normalized = channel_name.lower()
 
                 # Treat malformed reasoning markers as noise; preserve final prose stream.
                 if normalized and normalized not in {
@@ -72,116 +213,58 @@ class ChannelFilter:
                     "analysis",
                     "reasoning",
                 }:
-                    self.current_channel = channel_name.strip()
+                    self.current_channel = channel_name
 
-                self.buffer = self.buffer[close_idx + len(close_token) :]
+                pos = close_idx + len(close_token)
                 continue
 
-            match = self.tag_pattern.search(self.buffer)
-            if not match:
+            tag = _find_tag(buffer, pos)
+            if tag is None:
                 # No complete tag found.
                 # We should yield everything that is definitely not part of a tag.
-                # Tags start with '<'.
-                check_chars = ["<", "["]
-                first_bracket = -1
-                for char in check_chars:
-                    idx = self.buffer.find(char)
-                    if idx != -1:
-                        if first_bracket == -1 or idx < first_bracket:
-                            first_bracket = idx
+                # Tags start with '<' or '['.
+                next_lt = buffer.find("<", pos)
+                next_lb = buffer.find("[", pos)
+                if next_lt == -1 or next_lb == -1:
+                    first_bracket = max(next_lt, next_lb)
+                else:
+                    first_bracket = min(next_lt, next_lb)
 
                 if first_bracket == -1:
                     # No bracket at all, safe to yield everything
-                    if self.buffer:
-                        results.append(
-                            {"channel": self.current_channel, "content": self.buffer}
-                        )
-                        self.buffer = ""
-                elif first_bracket > 0:
+                    if pos < len(buffer):
+                        _append_segment(results, self.current_channel, buffer[pos:])
+                        pos = len(buffer)
+                elif first_bracket > pos:
                     # Yield everything before the first bracket
-                    results.append(
-                        {
-                            "channel": self.current_channel,
-                            "content": self.buffer[:first_bracket],
-                        }
+                    _append_segment(
+                        results, self.current_channel, buffer[pos:first_bracket]
                     )
-                    self.buffer = self.buffer[first_bracket:]
-
-                # Now the buffer starts with '<' or '[' (or is empty).
-                # Guard against pathological buffers by degrading to character
-                # passthrough when no recognizable tag is forming.
-                if len(self.buffer) > 150:
-                    # Emit a single character to keep progress monotonic and
-                    # prevent unbounded buffering.
-                    results.append(
-                        {"channel": self.current_channel, "content": self.buffer[0]}
-                    )
-                    self.buffer = self.buffer[1:]
+                    pos = first_bracket
+
+                # Now the pending text starts with '<' or '[' (or is empty).
+                # Guard against pathological buffers: only the last
+                # _MAX_PENDING_TAG_LEN characters are held back for a tag that
+                # may still complete; everything before them is emitted at once.
+                if len(buffer) - pos > _MAX_PENDING_TAG_LEN:
+                    cut = len(buffer) - _MAX_PENDING_TAG_LEN
+                    _append_segment(results, self.current_channel, buffer[pos:cut])
+                    pos = cut
                 break
             else:
                 # Yield content before the tag
-                start, end = match.span()
-                if start > 0:
-                    content = self.buffer[:start]
-                    results.append(
-                        {"channel": self.current_channel, "content": content}
-                    )
-
-                # Process the tag
-                tag_text = match.group(0)
+                start, end, channel = tag
+                if start > pos:
+                    _append_segment(results, self.current_channel, buffer[pos:start])
 
                 # Update output channel according to control tags.
-                if re.match(r"<(thought|thinking)>", tag_text, re.IGNORECASE):
-                    self.current_channel = "thought"
-                elif re.match(r"</(thought|thinking)>", tag_text, re.IGNORECASE):
-                    self.current_channel = "final"
-                elif re.match(
-                    r"\[TOOL_CALL\]\s*|<tool_call>|<\|tool_call\>",
-                    tag_text,
-                    re.IGNORECASE,
-                ):
-                    self.current_channel = "tool_def"
-                elif re.match(
-                    r"\[/TOOL_CALL\]|</tool_call>|<\|tool_call\|>|<tool_call\|>",
-                    tag_text,
-                    re.IGNORECASE,
-                ):
-                    self.current_channel = "final"
-                elif re.match(r"<\|?channel\|?>", tag_text, re.IGNORECASE):
-                    channel_name = ""
-
-                    strict_match = re.match(
-                        r"<\|channel\|>(.*?)<\|message\|>",
-                        tag_text,
-                        re.IGNORECASE | re.DOTALL,
-                    )
-                    if strict_match:
-                        channel_name = strict_match.group(1)
-
-                    if channel_name:
-                        if "<|constrain|>" in channel_name:
-                            channel_name = channel_name.split("<|constrain|>", 1)[0]
-                        self.current_channel = channel_name.strip()
-                elif (
-                    tag_text.startswith("<|start|>assistant")
-                    and "<|channel|>" in tag_text
-                ):
-                    channel_name = tag_text.split("<|channel|>", 1)[1]
-                    channel_name = channel_name.split("<|message|>", 1)[0]
-                    if "<|constrain|>" in channel_name:
-                        channel_name = channel_name.split("<|constrain|>", 1)[0]
-                    self.current_channel = channel_name.strip()
-                elif "<|message|>" in tag_text:
-                    # Message boundaries without explicit channel changes do not
-                    # require state transitions.
-                    pass
-                elif "<|end|>" in tag_text:
-                    # End markers reset to final output as a safe default.
-                    self.current_channel = "final"
-
-                # Advance buffer past the tag
-                self.buffer = self.buffer[end:]
+                if channel is not None:
+                    self.current_channel = channel
+
+                # Advance past the tag
+                pos = end
 
+        self.buffer = buffer[pos:]
         return results
 
     def flush(self) -> List[Dict[str, str]]:
@@ -190,4 +273,5 @@ class ChannelFilter:
         if self.buffer:
             results.append({"channel": self.current_channel, "content": self.buffer})
             self.buffer = ""
+        self._header_scan_from = 0
         return results
@@ -10,6 +10,7 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -51,6 +52,18 @@ os.environ["AUGQ_PROJECTS_REGISTRY"] = str(_SESSION_ROOT / "projects.json")
 os.environ["AUGQ_MACHINE_CONFIG_PATH"] = str(_SESSION_MACHINE_JSON)
 
 
+@pytest.fixture(autouse=True)
+def restore_environ():
+    """Undo every os.environ change a test makes once it finishes.
+
+    Test classes point AUGQ_PROJECTS_ROOT/REGISTRY at their own temp roots in
+    setUp; restoring here brings back the session values above instead of
+    each class popping the variables and leaving them unset.
+    """
+    with patch.dict(os.environ):
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def session_temp_env():
     temp_data = Path(os.environ["AUGQ_USER_DATA_DIR"])
@@ -5,7 +5,7 @@
 # the Free Software Foundation, either version 3 of the License, or
 # (at your option) any later version.
 
-"""Shared base class for API unittest modules with isolated temp project roots."""
+"""Shared base classes for API unittest modules: a per-class client and isolated temp project roots."""
 
 import os
 import tempfile
@@ -17,7 +17,18 @@ from fastapi.testclient import TestClient
 from augmentedquill.main import app
 
 
-class ApiTestCase(TestCase):
+class ClientTestCase(TestCase):
+    """TestCase with one TestClient shared by every test in the class."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The client holds no per-test state (paths are read from the
+        # environment per request), so one instance serves the whole class.
+        cls.client = TestClient(app)
+
+
+class ApiTestCase(ClientTestCase):
     def setUp(self):
         self.td = tempfile.TemporaryDirectory()
         self.addCleanup(self.td.cleanup)
@@ -26,12 +37,7 @@ class ApiTestCase(TestCase):
         self.projects_root.mkdir(parents=True, exist_ok=True)
         self.registry_path = Path(self.td.name) / "projects.json"
 
+        # conftest's restore_environ fixture puts the session values back.
         os.environ["AUGQ_USER_DATA_DIR"] = str(self.user_data_root)
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
-        self.client = TestClient(app)
-
-    def tearDown(self):
-        os.environ.pop("AUGQ_USER_DATA_DIR", None)
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
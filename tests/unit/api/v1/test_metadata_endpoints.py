@@ -26,6 +26,10 @@ class MetadataEndpointsTest(ApiTestCase):
         select_project("test_proj")
         self.proj_dir = self.projects_root / "test_proj"
 
+    def _read_story(self):
+        """Return the current project's story.json as written to disk."""
+        return json.loads((self.proj_dir / "story.json").read_text())
+
     def test_update_chapter_metadata(self):
         # Create a chapter
         chap_id = create_new_chapter("My Chapter")
@@ -51,7 +55,7 @@ class MetadataEndpointsTest(ApiTestCase):
         self.assertEqual(resp_partial.status_code, 200)
 
         # Verify persistence
-        story_json = json.loads((self.proj_dir / "story.json").read_text())
+        story_json = self._read_story()
         # Chapters are identified by filename in Novel projects. chap_id matches filename index.
         chap_filename = f"{chap_id:04d}.txt"
         chap_entry = next(
@@ -84,7 +88,7 @@ class MetadataEndpointsTest(ApiTestCase):
         # 1. Create a chapter normally
         chap_id = create_new_chapter("Initial Title")
         story_path = self.proj_dir / "story.json"
-        story = json.loads(story_path.read_text())
+        story = self._read_story()
 
         # 2. Corrupt/Wipe the metadata for this chapter in story.json
         story["chapters"] = []
@@ -100,7 +104,7 @@ class MetadataEndpointsTest(ApiTestCase):
         self.assertEqual(resp.status_code, 200)
 
         # 4. Verify it was recreated in story.json
-        story_after = json.loads(story_path.read_text())
+        story_after = self._read_story()
         self.assertEqual(len(story_after["chapters"]), 1)
         entry = story_after["chapters"][0]
         self.assertEqual(entry["title"], "Recovered Title")
@@ -128,7 +132,7 @@ class MetadataEndpointsTest(ApiTestCase):
         self.assertEqual(resp.status_code, 200)
 
         # Verify
-        story_json = json.loads((self.proj_dir / "story.json").read_text())
+        story_json = self._read_story()
         self.assertEqual(story_json["project_title"], "New Title")
         self.assertEqual(story_json["story_summary"], "Main story summary")
         self.assertEqual(story_json["tags"], ["Sci-Fi", "Noir"])
@@ -156,7 +160,7 @@ class MetadataEndpointsTest(ApiTestCase):
         self.assertEqual(resp.status_code, 200)
 
         # Verify
-        story_json = json.loads((self.proj_dir / "story.json").read_text())
+        story_json = self._read_story()
         book_entry = next(
             b
             for b in story_json["books"]
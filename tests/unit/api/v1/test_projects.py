@@ -68,6 +68,27 @@ class ProjectsTest(ApiTestCase):
         reg2 = json.loads(self.registry_path.read_text(encoding="utf-8"))
         self.assertEqual(reg2.get("current"), str(self.projects_root / empty_name))
 
+    def test_reselecting_active_project_keeps_registry_untouched(self):
+        ok, msg = select_project("again")
+        self.assertTrue(ok, msg)
+        self.registry_path.write_text(
+            self.registry_path.read_text(encoding="utf-8") + "\n", encoding="utf-8"
+        )
+        before = self.registry_path.read_text(encoding="utf-8")
+
+        ok, msg = select_project("again")
+        self.assertTrue(ok, msg)
+        self.assertEqual(self.registry_path.read_text(encoding="utf-8"), before)
+
+        ok, msg = select_project("other")
+        self.assertTrue(ok, msg)
+        ok, msg = select_project("again")
+        self.assertTrue(ok, msg)
+        self.assertEqual(
+            load_registry()["recent"][:2],
+            [str(self.projects_root / "again"), str(self.projects_root / "other")],
+        )
+
     def test_select_rejects_non_project(self):
         # Create a directory under projects root that is not a valid project
         bad_name = "badproj"
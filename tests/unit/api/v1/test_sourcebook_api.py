@@ -13,6 +13,16 @@ from unittest.mock import AsyncMock, patch
 from augmentedquill.services.projects.projects import select_project
 from tests.unit.api.v1.api_test_case import ApiTestCase
 
+_SOURCEBOOK_STORY_JSON = json.dumps(
+    {
+        "metadata": {"version": 2},
+        "project_title": "Sourcebook API",
+        "format": "markdown",
+        "project_type": "novel",
+        "sourcebook": {},
+    }
+)
+
 
 class SourcebookApiTest(ApiTestCase):
     def setUp(self):
@@ -22,14 +32,7 @@ class SourcebookApiTest(ApiTestCase):
         self.assertTrue(ok, msg)
 
         pdir = self.projects_root / "sourcebook_api_proj"
-        story = {
-            "metadata": {"version": 2},
-            "project_title": "Sourcebook API",
-            "format": "markdown",
-            "project_type": "novel",
-            "sourcebook": {},
-        }
-        (pdir / "story.json").write_text(json.dumps(story), encoding="utf-8")
+        (pdir / "story.json").write_text(_SOURCEBOOK_STORY_JSON, encoding="utf-8")
 
     def test_sourcebook_api_crud(self):
         create = self.client.post(
@@ -8,13 +8,19 @@
 """Defines the test story endpoints unit so this responsibility stays isolated, testable, and easy to evolve."""
 
 import asyncio
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 from augmentedquill.api.v1.story_routes import generation_streaming
 import augmentedquill.services.llm.llm as llm
 from augmentedquill.services.projects.projects import select_project
 from tests.unit.api.v1.api_test_case import ApiTestCase
 
+# (base_url, api_key, model_id, timeout_s, model_name) returned by the fake
+# credential resolver.
+_FAKE_CREDENTIALS = ("https://fake.local/v1", None, "fake-model", 5, "fake-model")
+
 
 class StoryEndpointsTest(ApiTestCase):
 
@@ -62,18 +68,18 @@ class StoryEndpointsTest(ApiTestCase):
                 },
             )
 
-        import json
-
         (pdir / "story.json").write_text(json.dumps(story_cfg), encoding="utf-8")
         return pdir
 
+    def _read_story(self, pdir: Path) -> dict:
+        """Return the project's story.json as written to disk."""
+        return json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+
     def _make_series_project(self, name: str = "series") -> Path:
         ok, msg = select_project(name)
         self.assertTrue(ok, msg)
         pdir = self.projects_root / name
 
-        import json
-
         story_cfg = {
             "project_title": "Series P",
             "project_type": "series",
@@ -113,9 +119,7 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertTrue(data.get("ok"))
         self.assertEqual(data["chapter"]["summary"], "New summary")
         # Verify persisted
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["chapters"][0]["summary"], "New summary")
 
     def test_put_summary_404_invalid_id(self):
@@ -124,11 +128,20 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertEqual(r.status_code, 404)
 
     # ---- Story LLM endpoints with fakes ----
-    def _patch_llm(self):
-        # Patch credentials and completion in augmentedquill.services.llm.llm
-        self._orig_resolve = llm.resolve_openai_credentials
-        self._orig_unified = llm.unified_chat_complete
+    def _patch_attr(self, target: object, name: str, value: object) -> None:
+        """Replace ``target.name`` with ``value`` until the test finishes."""
+        patcher = patch.object(target, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _patch_credentials(self) -> None:
+        self._patch_attr(
+            llm,
+            "resolve_openai_credentials",
+            lambda payload, **kwargs: _FAKE_CREDENTIALS,
+        )
 
+    def _patch_llm(self):
         async def fake_complete(**kwargs):  # type: ignore
             # Return a minimal response
             content = kwargs.get("messages", [{}])[-1].get("content", "")
@@ -141,20 +154,8 @@ class StoryEndpointsTest(ApiTestCase):
                 txt = "AI summary"
             return {"content": txt, "tool_calls": [], "thinking": ""}
 
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-        llm.unified_chat_complete = fake_complete  # type: ignore
-
-        def _undo():
-            llm.resolve_openai_credentials = self._orig_resolve  # type: ignore
-            llm.unified_chat_complete = self._orig_unified  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_credentials()
+        self._patch_attr(llm, "unified_chat_complete", fake_complete)
 
     def test_story_summary_updates_and_persists(self):
         pdir = self._make_project()
@@ -167,15 +168,11 @@ class StoryEndpointsTest(ApiTestCase):
         data = r.json()
         self.assertTrue(data.get("ok"))
         self.assertEqual(data["summary"], "AI summary")
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["chapters"][0]["summary"], "AI summary")
 
     def test_story_story_summary_for_series_uses_book_summaries(self):
         pdir = self._make_series_project()
-        self._orig_resolve = llm.resolve_openai_credentials
-        self._orig_unified = llm.unified_chat_complete
 
         async def fake_complete(**kwargs):  # type: ignore
             content = kwargs.get("messages", [{}])[-1].get("content", "")
@@ -186,20 +183,8 @@ class StoryEndpointsTest(ApiTestCase):
             self.assertNotIn("CHAPTER ONLY TWO", content)
             return {"content": "Series AI summary", "tool_calls": [], "thinking": ""}
 
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-        llm.unified_chat_complete = fake_complete  # type: ignore
-
-        def _undo():
-            llm.resolve_openai_credentials = self._orig_resolve  # type: ignore
-            llm.unified_chat_complete = self._orig_unified  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_credentials()
+        self._patch_attr(llm, "unified_chat_complete", fake_complete)
 
         r = self.client.post(
             "/api/v1/story/story-summary",
@@ -210,9 +195,7 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertTrue(data.get("ok"))
         self.assertEqual(data["summary"], "Series AI summary")
 
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["story_summary"], "Series AI summary")
 
     def test_story_write_overwrites_file(self):
@@ -257,10 +240,6 @@ class StoryEndpointsTest(ApiTestCase):
         pdir = self._make_project()
 
         # Patch the completions stream used by the suggest endpoint
-        # Patch the completions stream used by the suggest endpoint
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-
         async def fake_stream(prompt: str, **kwargs):
             # ensure our enhanced context made it into the prompt text
             # it will be passed as the single argument to the llm call
@@ -294,29 +273,13 @@ class StoryEndpointsTest(ApiTestCase):
             self.assertIn("EntryOne", content)
             return {"content": "EntryOne"}
 
-        llm.openai_completions_stream = fake_stream  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
+        self._patch_attr(llm, "openai_completions_stream", fake_stream)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
         # Also ensure credential resolution succeeds for this test
-        orig_resolve = llm.resolve_openai_credentials
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_credentials()
 
         # make sure chapter notes are included in prompt
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         story["chapters"][0]["notes"] = "Use quote from sage"
         (pdir / "story.json").write_text(json.dumps(story), encoding="utf-8")
 
@@ -351,9 +314,6 @@ class StoryEndpointsTest(ApiTestCase):
         )
         self._patch_llm()
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-
         async def fake_stream2(prompt: str, **kwargs):
             self.assertIn("Story title: P", prompt)
             self.assertNotIn("Story description:", prompt)
@@ -363,7 +323,7 @@ class StoryEndpointsTest(ApiTestCase):
             self.assertIn("Chapter title: T1", prompt)
             yield "whatever"
 
-        llm.openai_completions_stream = fake_stream2  # type: ignore
+        self._patch_attr(llm, "openai_completions_stream", fake_stream2)
 
         async def fake_edit2(**kwargs):
             # editing selector should be invoked even with no entries
@@ -371,23 +331,9 @@ class StoryEndpointsTest(ApiTestCase):
             self.assertTrue(any("Entries:" in m.get("content", "") for m in msgs))
             return {"content": ""}
 
-        llm.unified_chat_complete = fake_edit2  # type: ignore
+        self._patch_attr(llm, "unified_chat_complete", fake_edit2)
         # patch resolve
-        orig_resolve = llm.resolve_openai_credentials
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo2():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo2)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest", json={"chap_id": 1, "current_text": "Hi"}
@@ -402,10 +348,6 @@ class StoryEndpointsTest(ApiTestCase):
         """Pure suggest mode should pass only current chapter text to the model."""
         self._make_project(name="novel_pure_mode")
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-
         seen_prompt = {"value": ""}
 
         async def fake_stream(prompt: str, **kwargs):
@@ -415,22 +357,9 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_completions_stream = fake_stream  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_completions_stream", fake_stream)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -447,10 +376,6 @@ class StoryEndpointsTest(ApiTestCase):
         """Instructed suggest mode should use role-based chat messages."""
         self._make_project(name="novel_original_mode")
 
-        orig_stream = llm.openai_chat_complete_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-
         seen_messages = {"value": []}
 
         async def fake_stream(messages: list[dict[str, str]], **kwargs):
@@ -460,22 +385,9 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_chat_complete_stream = fake_stream  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_chat_complete_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_chat_complete_stream", fake_stream)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -503,10 +415,6 @@ class StoryEndpointsTest(ApiTestCase):
         """Loop detection truncates repetitive text to the last clean prefix without retrying."""
         self._make_project(name="novel_loop_guard")
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-
         call_index = {"value": 0}
 
         async def fake_stream_loop(prompt: str, **kwargs):
@@ -519,22 +427,9 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_completions_stream = fake_stream_loop  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_completions_stream", fake_stream_loop)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -549,10 +444,6 @@ class StoryEndpointsTest(ApiTestCase):
         """Loop detection is always-on; repetitive output is truncated to the last clean sentence."""
         self._make_project(name="novel_loop_guard_disabled")
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-
         call_index = {"value": 0}
 
         async def fake_stream_loop(prompt: str, **kwargs):
@@ -562,22 +453,9 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_completions_stream = fake_stream_loop  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_completions_stream", fake_stream_loop)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -597,10 +475,6 @@ class StoryEndpointsTest(ApiTestCase):
         """
         self._make_project(name="novel_stream_newline_prefix")
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-
         async def fake_stream_chunks(prompt: str, **kwargs):
             # Simulate a model that starts with paragraph separation then prose.
             yield "\n\n"
@@ -610,22 +484,9 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_completions_stream = fake_stream_chunks  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_completions_stream", fake_stream_chunks)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -663,11 +524,6 @@ class StoryEndpointsTest(ApiTestCase):
         """Stalled provider stream should not block suggestion forever."""
         self._make_project(name="novel_stream_idle")
 
-        orig_stream = llm.openai_completions_stream
-        orig_edit = llm.unified_chat_complete
-        orig_resolve = llm.resolve_openai_credentials
-        orig_idle_timeout = generation_streaming.SUGGEST_STREAM_IDLE_TIMEOUT_S
-
         async def fake_stream_idle(prompt: str, **kwargs):
             yield "He stepped into the rain and pulled his coat tighter."
             await asyncio.sleep(0.05)
@@ -676,24 +532,10 @@ class StoryEndpointsTest(ApiTestCase):
         async def fake_edit(**kwargs):
             return {"content": ""}
 
-        llm.openai_completions_stream = fake_stream_idle  # type: ignore
-        llm.unified_chat_complete = fake_edit  # type: ignore
-        llm.resolve_openai_credentials = lambda payload, **kwargs: (
-            "https://fake.local/v1",
-            None,
-            "fake-model",
-            5,
-            "fake-model",
-        )  # type: ignore
-        generation_streaming.SUGGEST_STREAM_IDLE_TIMEOUT_S = 0.01
-
-        def _undo():
-            llm.openai_completions_stream = orig_stream  # type: ignore
-            llm.unified_chat_complete = orig_edit  # type: ignore
-            llm.resolve_openai_credentials = orig_resolve  # type: ignore
-            generation_streaming.SUGGEST_STREAM_IDLE_TIMEOUT_S = orig_idle_timeout
-
-        self.addCleanup(_undo)
+        self._patch_attr(llm, "openai_completions_stream", fake_stream_idle)
+        self._patch_attr(llm, "unified_chat_complete", fake_edit)
+        self._patch_credentials()
+        self._patch_attr(generation_streaming, "SUGGEST_STREAM_IDLE_TIMEOUT_S", 0.01)
 
         r = self.client.post(
             "/api/v1/story/suggest",
@@ -714,9 +556,7 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertTrue(data.get("ok"))
 
         # Verify persisted in story.json
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["project_title"], new_title)
 
     def test_put_story_summary_updates_and_persists(self):
@@ -728,9 +568,7 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertTrue(data.get("ok"))
 
         # Verify persisted in story.json
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["story_summary"], new_summary)
 
     def test_put_story_tags_updates_and_persists(self):
@@ -742,7 +580,5 @@ class StoryEndpointsTest(ApiTestCase):
         self.assertTrue(data.get("ok"))
 
         # Verify persisted in story.json
-        import json
-
-        story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
+        story = self._read_story(pdir)
         self.assertEqual(story["tags"], new_tags)
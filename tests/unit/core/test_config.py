@@ -9,12 +9,18 @@
 
 import logging
 import os
+import stat
 import tempfile
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import TestCase
 
-from augmentedquill.core.config import load_machine_config, load_story_config
+from augmentedquill.core.config import (
+    load_machine_config,
+    load_story_config,
+    save_story_config,
+)
 
 
 class ConfigLoaderTest(TestCase):
@@ -169,3 +175,48 @@ class MachineSchemaValidationTest(TestCase):
 
             machine_warnings = [m for m in cm.output if "machine config" in m]
             self.assertEqual(machine_warnings, [])
+
+    def test_save_story_config_replaces_file_without_leftovers(self):
+        with tempfile.TemporaryDirectory() as td:
+            story_path = Path(td) / "story.json"
+            story_path.write_text('{"project_title": "Old"}', encoding="utf-8")
+
+            save_story_config(
+                story_path, {"project_title": "Nouveau été", "chapters": []}
+            )
+
+            self.assertEqual(
+                json.loads(story_path.read_text(encoding="utf-8"))["project_title"],
+                "Nouveau été",
+            )
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), ["story.json"])
+
+    def test_save_story_config_concurrent_saves_do_not_collide(self):
+        with tempfile.TemporaryDirectory() as td:
+            story_path = Path(td) / "story.json"
+
+            def _save(worker: int) -> None:
+                for i in range(50):
+                    save_story_config(
+                        story_path, {"project_title": f"w{worker}-{i}", "chapters": []}
+                    )
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                # list() re-raises any exception from a worker.
+                list(pool.map(_save, range(4)))
+
+            title = json.loads(story_path.read_text(encoding="utf-8"))["project_title"]
+            self.assertRegex(title, r"^w[0-3]-49$")
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), ["story.json"])
+
+    def test_save_story_config_keeps_existing_file_mode(self):
+        if os.name != "posix":
+            self.skipTest("POSIX permission bits")
+        with tempfile.TemporaryDirectory() as td:
+            story_path = Path(td) / "story.json"
+            story_path.write_text("{}", encoding="utf-8")
+            os.chmod(story_path, 0o640)
+
+            save_story_config(story_path, {"project_title": "P", "chapters": []})
+
+            self.assertEqual(stat.S_IMODE(story_path.stat().st_mode), 0o640)
@@ -52,10 +52,6 @@ class ConflictsTest(TestCase):
         )
         select_project(self.project_name)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_conflict_operations(self):
         chap_id = 1
 
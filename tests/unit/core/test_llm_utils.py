@@ -11,6 +11,8 @@ import asyncio
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, patch
 
+import httpx
+
 from augmentedquill.utils import llm_utils
 
 
@@ -99,3 +101,31 @@ class LlmUtilsTest(IsolatedAsyncioTestCase):
             )
 
         self.assertEqual(mocked_probe.await_count, 2)
+
+    async def test_probe_cancels_partner_when_endpoint_unreachable(self):
+        partner_cancelled = asyncio.Event()
+
+        async def fake_request(**kwargs):
+            if kwargs["caller_id"].endswith("check_vision"):
+                raise httpx.ConnectError("connection refused")
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                partner_cancelled.set()
+                raise
+
+        with patch.object(llm_utils, "logged_request", side_effect=fake_request):
+            result = await asyncio.wait_for(
+                llm_utils._probe_model_capabilities(
+                    base_url="https://example.invalid/v1",
+                    api_key="secret",
+                    model_id="gpt-demo",
+                    timeout_s=5,
+                ),
+                timeout=2,
+            )
+
+        self.assertEqual(
+            result, {"is_multimodal": False, "supports_function_calling": False}
+        )
+        self.assertTrue(partner_cancelled.is_set())
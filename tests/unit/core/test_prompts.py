@@ -78,3 +78,33 @@ class PromptsTest(TestCase):
             chat_msg,
         )
         self.assertIn("write_story_content", editing_msg)
+
+    def test_template_index_matches_default_prompts(self):
+        from augmentedquill.core import prompts
+
+        for key, entry in prompts.DEFAULT_PROMPTS.items():
+            expected = entry.get("en") or ""
+            self.assertEqual(prompts._resolve_template(key, None, "EN"), expected)
+            self.assertEqual(prompts._resolve_template(key, {}, "zz"), expected)
+        self.assertEqual(prompts._resolve_template("no_such_prompt", None, "en"), "")
+        self.assertEqual(
+            prompts._resolve_template("story_writer", {"story_writer": "x"}, "de"),
+            "x",
+        )
+
+    def test_format_keeps_escaped_braces_and_tolerates_missing_keys(self):
+        from augmentedquill.core import prompts
+
+        overrides = {"custom": 'Use {{"k": 1}} for {name}.'}
+        for _ in range(2):
+            self.assertEqual(
+                get_user_prompt("custom", user_prompt_overrides=overrides, name="x"),
+                'Use {"k": 1} for x.',
+            )
+        self.assertEqual(
+            get_user_prompt("custom", user_prompt_overrides=overrides, other="y"),
+            'Use {{"k": 1}} for {name}.',
+        )
+        self.assertEqual(
+            prompts._format_template("Hi {name}", {"name": "Ann"}), "Hi Ann"
+        )
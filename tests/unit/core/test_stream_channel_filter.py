@@ -100,9 +100,8 @@ class TestChannelFilter(unittest.TestCase):
         # progress logic once the internal buffer grows beyond the guard threshold.
         chunk = "<" + ("x" * 180)
         out = cf.feed(chunk)
-        self.assertGreaterEqual(len(out), 1)
-        self.assertEqual(out[0]["channel"], "final")
-        self.assertEqual(out[0]["content"], "<")
+        self.assertEqual(out, [{"channel": "final", "content": chunk[:-150]}])
+        self.assertEqual(cf.buffer, chunk[-150:])
 
     def test_malformed_channel_headers_are_consumed_without_switching_to_reasoning(
         self,
@@ -133,6 +132,63 @@ class TestChannelFilter(unittest.TestCase):
         out = cf.feed("Hello")
         self.assertEqual(out, [{"channel": "final", "content": "Hello"}])
 
+    def test_bracket_tool_call_closer_after_whitespace_returns_to_final(self):
+        cf = ChannelFilter()
+
+        out = cf.feed("[TOOL_CALL] get_story_metadata \n[/TOOL_CALL]Back to prose")
+        self.assertEqual(
+            out,
+            [
+                {"channel": "tool_def", "content": "get_story_metadata"},
+                {"channel": "final", "content": "Back to prose"},
+            ],
+        )
+        self.assertEqual(cf.current_channel, "final")
+
+    def test_prose_brackets_that_are_not_tags_pass_through(self):
+        cf = ChannelFilter()
+
+        out = cf.feed("She wrote <i>never</i> [sic]. ")
+        out += cf.feed("Then <thought>hidden</thought>left.")
+        self.assertEqual(
+            "".join(part["content"] for part in out if part["channel"] == "final"),
+            "She wrote <i>never</i> [sic]. Then left.",
+        )
+        self.assertIn({"channel": "thought", "content": "hidden"}, out)
+
+    def test_malformed_channel_header_closer_split_across_chunks(self):
+        cf = ChannelFilter()
+
+        # The header waits for its closer over many chunks, and the closer
+        # itself arrives split across a chunk boundary.
+        self.assertEqual(cf.feed("<|channel>commentary"), [])
+        for _ in range(50):
+            self.assertEqual(cf.feed(" "), [])
+        self.assertEqual(cf.feed("<chan"), [])
+        out = cf.feed("nel|>Shown")
+        self.assertEqual(out, [{"channel": "commentary", "content": "Shown"}])
+
+    def test_single_large_chunk_with_many_tags(self):
+        cf = ChannelFilter()
+
+        out = cf.feed("<thought>plan</thought>Answer. " * 500)
+        self.assertEqual(len(out), 1000)
+        self.assertEqual(out[0], {"channel": "thought", "content": "plan"})
+        self.assertEqual(out[-1], {"channel": "final", "content": "Answer. "})
+        self.assertEqual(cf.buffer, "")
+
+    def test_text_around_channel_preserving_tags_is_one_fragment(self):
+        cf = ChannelFilter()
+
+        out = cf.feed("Before<|start|>assistant<|message|>after<thought>hm<thought>m")
+        self.assertEqual(
+            out,
+            [
+                {"channel": "final", "content": "Beforeafter"},
+                {"channel": "thought", "content": "hmm"},
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
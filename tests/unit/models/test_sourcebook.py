@@ -7,10 +7,12 @@
 
 """Defines the test sourcebook unit so this responsibility stays isolated, testable, and easy to evolve."""
 
-import tempfile
+import json
 import os
+import tempfile
 from pathlib import Path
 from unittest import TestCase
+
 from augmentedquill.services.sourcebook.sourcebook_helpers import (
     sourcebook_create_entry,
     sourcebook_get_entry,
@@ -18,6 +20,16 @@ from augmentedquill.services.sourcebook.sourcebook_helpers import (
     sourcebook_delete_entry,
 )
 
+_STORY_JSON = json.dumps(
+    {
+        "metadata": {"version": 2},
+        "project_title": "Test Project",
+        "format": "markdown",
+        "project_type": "novel",
+        "sourcebook": [],
+    }
+)
+
 
 class SourcebookTest(TestCase):
     def setUp(self):
@@ -26,42 +38,17 @@ class SourcebookTest(TestCase):
 
         # Setup mock project environment
         self.projects_root = Path(self.td.name) / "projects"
-        self.projects_root.mkdir(parents=True)
-
         self.proj_dir = self.projects_root / "test_proj"
-        self.proj_dir.mkdir()
-
-        story = {
-            "metadata": {"version": 2},
-            "project_title": "Test Project",
-            "format": "markdown",
-            "project_type": "novel",
-            "sourcebook": [],
-        }
-        with open(self.proj_dir / "story.json", "w") as f:
-            import json
-
-            json.dump(story, f)
-
-        # Mock environment vars
-        os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
-
-        # Mock get_active_project_dir via MonkeyPatching not easily done in unittest without mock lib
-        # But wait, augmentedquill.services.projects.projects.get_active_project_dir uses AUGQ_PROJECTS_REGISTRY
-        # I need to set up the registry to point to our test project.
+        self.proj_dir.mkdir(parents=True)
+        (self.proj_dir / "story.json").write_text(_STORY_JSON, encoding="utf-8")
 
+        # get_active_project_dir reads the registry, so point it at the test project.
         self.registry_path = Path(self.td.name) / "projects.json"
-        os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
-
         registry = {"current": str(self.proj_dir.resolve()), "recent": []}
-        with open(self.registry_path, "w") as f:
-            import json
-
-            json.dump(registry, f)
+        self.registry_path.write_text(json.dumps(registry), encoding="utf-8")
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
+        os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
+        os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
 
     def test_sourcebook_features(self):
         # 1. Create
@@ -21,27 +21,23 @@ from augmentedquill.utils.llm_parsing import (
     strip_tool_call_tags,
 )
 
-
-class TestChatParser(unittest.TestCase):
-    def test_parse_json_inside_tool_call_tag(self):
-        """Test parsing of JSON content inside <tool_call> tags."""
-        content = """
+# (content, expected tool name, expected arguments) for inputs that must
+# parse to exactly one tool call.
+_SINGLE_TOOL_CALL_CASES = [
+    (
+        # JSON content inside <tool_call> tags.
+        """
         Thinking process...
         <tool_call>
         {"name": "generate_image_description", "arguments": {"filename": "exomis_1024x1024.png"}}
         </tool_call>
+        """,
+        "generate_image_description",
+        {"filename": "exomis_1024x1024.png"},
+    ),
+    (
+        # Multiline JSON content inside <tool_call> tags.
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        call = calls[0]
-        self.assertEqual(call["function"]["name"], "generate_image_description")
-        args = json.loads(call["function"]["arguments"])
-        self.assertEqual(args["filename"], "exomis_1024x1024.png")
-
-    def test_parse_json_with_newlines_inside_tool_call_tag(self):
-        """Test parsing of multiline JSON content inside <tool_call> tags."""
-        content = """
         <tool_call>
         {
             "name": "create_project", 
@@ -51,33 +47,23 @@ class TestChatParser(unittest.TestCase):
             }
         }
         </tool_call>
+        """,
+        "create_project",
+        {"name": "Test Project", "type": "short-story"},
+    ),
+    (
+        # Legacy XML-style tool call.
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        call = calls[0]
-        self.assertEqual(call["function"]["name"], "create_project")
-        args = json.loads(call["function"]["arguments"])
-        self.assertEqual(args["name"], "Test Project")
-        self.assertEqual(args["type"], "short-story")
-
-    def test_parse_xml_style_tool_call(self):
-        """Test parsing of legacy XML-style tool calls."""
-        content = """
         <tool_call>
         <function=get_chapter_content>{"chap_id": 1}</function>
         </tool_call>
+        """,
+        "get_chapter_content",
+        {"chap_id": 1},
+    ),
+    (
+        # XML-style tool call that encodes args as parameter tags.
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        self.assertEqual(calls[0]["function"]["name"], "get_chapter_content")
-        args = json.loads(calls[0]["function"]["arguments"])
-        self.assertEqual(args["chap_id"], 1)
-
-    def test_parse_xml_style_tool_call_parameter_tags(self):
-        """Test parsing of XML-style tool calls that encode args as parameter tags."""
-        content = """
         <tool_call>
         <function=get_chapter_metadata>
         <parameter=chap_id>
@@ -85,56 +71,59 @@ class TestChatParser(unittest.TestCase):
         </parameter>
         </function>
         </tool_call>
+        """,
+        "get_chapter_metadata",
+        {"chap_id": 6},
+    ),
+    (
+        # XML-style tool call with multiple typed parameters.
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        self.assertEqual(calls[0]["function"]["name"], "get_chapter_metadata")
-        args = json.loads(calls[0]["function"]["arguments"])
-        self.assertEqual(args["chap_id"], 6)
-
-    def test_parse_xml_style_tool_call_multiple_parameter_tags(self):
-        """Test parsing of XML-style tool calls with multiple typed parameters."""
-        content = """
         <tool_call>
         <function=update_chapter_metadata>
         <parameter=chap_id>4</parameter>
         <parameter=notes>"Updated notes"</parameter>
         </function>
         </tool_call>
+        """,
+        "update_chapter_metadata",
+        {"chap_id": 4, "notes": "Updated notes"},
+    ),
+    (
+        # Function call style: Tool(Args).
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        args = json.loads(calls[0]["function"]["arguments"])
-        self.assertEqual(args["chap_id"], 4)
-        self.assertEqual(args["notes"], "Updated notes")
-
-    def test_parse_func_call_style(self):
-        """Test parsing of function call style: Tool(Args)."""
-        content = """
         <tool_call>
         get_chapter_content({"chap_id": 2})
         </tool_call>
+        """,
+        "get_chapter_content",
+        {"chap_id": 2},
+    ),
+    (
+        # Surrounding prose is ignored.
         """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        self.assertEqual(calls[0]["function"]["name"], "get_chapter_content")
-        args = json.loads(calls[0]["function"]["arguments"])
-        self.assertEqual(args["chap_id"], 2)
-
-    def test_mixed_content_ignore_text(self):
-        content = """
         Here is some text.
         <tool_call>
         {"name": "test_tool", "arguments": {}}
         </tool_call>
         And more text.
-        """
-        calls = _parse_tool_calls_from_content(content)
-        self.assertIsNotNone(calls)
-        self.assertEqual(len(calls), 1)
-        self.assertEqual(calls[0]["function"]["name"], "test_tool")
+        """,
+        "test_tool",
+        {},
+    ),
+]
+
+
+class TestChatParser(unittest.TestCase):
+    def test_parse_single_tool_call_formats(self):
+        """Each supported tool call syntax yields one call with the expected args."""
+        for content, expected_name, expected_args in _SINGLE_TOOL_CALL_CASES:
+            with self.subTest(tool=expected_name, args=expected_args):
+                calls = _parse_tool_calls_from_content(content)
+                self.assertIsNotNone(calls)
+                self.assertEqual(len(calls), 1)
+                function = calls[0]["function"]
+                self.assertEqual(function["name"], expected_name)
+                self.assertEqual(json.loads(function["arguments"]), expected_args)
 
     def test_invalid_json_is_ignored(self):
         content = """
@@ -175,7 +164,7 @@ class TestChatParser(unittest.TestCase):
                 "content": '{"verbose": true}',
             }
         ]
-        events = parse_stream_channel_fragments(fragments, set())
+        events = list(parse_stream_channel_fragments(fragments, set()))
         self.assertEqual(len(events), 1)
         tc = events[0]["tool_calls"][0]
         self.assertEqual(tc["function"]["name"], "get_project_overview")
@@ -189,9 +178,25 @@ class TestChatParser(unittest.TestCase):
                 "content": "{}",
             }
         ]
-        events = parse_stream_channel_fragments(fragments, seen)
+        events = list(parse_stream_channel_fragments(fragments, seen))
         self.assertEqual(events, [])
 
+    def test_parse_stream_channel_fragments_detects_inline_tool_syntax(self):
+        fragments = [
+            {"channel": "final", "content": "  TOOL: get_story_metadata"},
+            {
+                "channel": "final",
+                "content": "<TOOL_CALL>get_chapter_summary</TOOL_CALL>",
+            },
+            {"channel": "final", "content": "We call: nobody."},
+        ]
+        events = list(parse_stream_channel_fragments(fragments, set()))
+        names = [
+            tc["function"]["name"] for evt in events for tc in evt.get("tool_calls", [])
+        ]
+        self.assertEqual(names, ["get_story_metadata", "get_chapter_summary"])
+        self.assertEqual(events[-1], {"content": "We call: nobody."})
+
     def test_parse_stream_channel_fragments_filters_marker_noise_keeps_newlines(self):
         fragments = [
             {"channel": "final", "content": "<|channel>thought\n<channel|>"},
@@ -201,7 +206,7 @@ class TestChatParser(unittest.TestCase):
             {"channel": "final", "content": "Paragraph two."},
         ]
 
-        events = parse_stream_channel_fragments(fragments, set())
+        events = list(parse_stream_channel_fragments(fragments, set()))
         content = "".join(evt.get("content", "") for evt in events if "content" in evt)
 
         self.assertNotIn("<|channel>", content)
@@ -216,6 +221,10 @@ class TestChatParser(unittest.TestCase):
         )
         self.assertEqual(strip_thinking_tags(content), "Visible answer")
 
+    def test_strip_thinking_tags_drops_analysis_without_final_channel(self):
+        content = "<|channel|>analysis<|message|>Hidden reasoning<|end|> Partial"
+        self.assertEqual(strip_thinking_tags(content), "Partial")
+
     def test_strip_thinking_tags_removes_inline_thinking_blocks(self):
         content = "Before <thinking>hidden</thinking> After"
         self.assertEqual(strip_thinking_tags(content), "Before  After")
@@ -241,12 +250,12 @@ class TestChatParser(unittest.TestCase):
 
     def test_parse_stream_channel_fragments_treats_analysis_channel_as_thinking(self):
         fragments = [{"channel": "analysis", "content": "internal reasoning"}]
-        events = parse_stream_channel_fragments(fragments, set())
+        events = list(parse_stream_channel_fragments(fragments, set()))
         self.assertEqual(events, [{"thinking": "internal reasoning"}])
 
     def test_parse_stream_channel_fragments_treats_reasoning_channel_as_thinking(self):
         fragments = [{"channel": "reasoning", "content": "hidden chain"}]
-        events = parse_stream_channel_fragments(fragments, set())
+        events = list(parse_stream_channel_fragments(fragments, set()))
         self.assertEqual(events, [{"thinking": "hidden chain"}])
 
     def test_strip_tool_call_tags_removes_tool_markup(self):
@@ -278,6 +287,96 @@ class TestChatParser(unittest.TestCase):
         content = "<thought>internal note</thought> final"
         self.assertEqual(extract_thinking_from_content(content), "internal note")
 
+    def test_plain_prose_passes_through_parsers_unchanged(self):
+        content = "She paused at the door.\n\nThen she knocked twice."
+        self.assertIsNone(_parse_tool_calls_from_content(content))
+        self.assertEqual(strip_thinking_tags(content), content)
+        self.assertEqual(strip_tool_call_tags(content), content)
+        self.assertEqual(extract_thinking_from_content(content), "")
+        self.assertEqual(strip_thinking_tags("  Analysis "), "")
+
+    def test_tool_prefix_detected_case_insensitively(self):
+        calls = _parse_tool_calls_from_content("TOOL: get_project_overview")
+        self.assertIsNotNone(calls)
+        self.assertEqual(calls[0]["function"]["name"], "get_project_overview")
+
+    def test_repeated_tool_calls_get_unique_ids(self):
+        content = (
+            "<tool_call>get_chapter_summary</tool_call>"
+            "<tool_call>get_chapter_summary</tool_call>"
+            "[TOOL_CALL]get_chapter_summary[/TOOL_CALL]"
+        )
+        calls = _parse_tool_calls_from_content(content)
+        self.assertEqual(
+            [c["id"] for c in calls],
+            [
+                "call_get_chapter_summary",
+                "call_get_chapter_summary_1",
+                "call_get_chapter_summary_2",
+            ],
+        )
+
+    def test_mixed_tool_call_formats_keep_textual_order(self):
+        content = (
+            "[TOOL_CALL]get_story_metadata[/TOOL_CALL]\n"
+            "<tool_call>get_chapter_summary</tool_call>\n"
+            "Tool: get_project_overview"
+        )
+        calls = _parse_tool_calls_from_content(content, include_original_text=True)
+        self.assertEqual(
+            [c["function"]["name"] for c in calls],
+            ["get_story_metadata", "get_chapter_summary", "get_project_overview"],
+        )
+        self.assertEqual(
+            calls[1]["original_text"], "<tool_call>get_chapter_summary</tool_call>"
+        )
+        self.assertNotIn("original_text", _parse_tool_calls_from_content(content)[0])
+
+    def test_valid_json_arguments_pass_through_verbatim(self):
+        content = '[TOOL_CALL]search_sourcebook({"query": "Zoë"})[/TOOL_CALL]'
+        calls = _parse_tool_calls_from_content(content)
+        self.assertEqual(calls[0]["function"]["arguments"], '{"query": "Zoë"}')
+
+        broken = "[TOOL_CALL]search_sourcebook(not json)[/TOOL_CALL]"
+        calls = _parse_tool_calls_from_content(broken)
+        self.assertEqual(json.loads(calls[0]["function"]["arguments"]), {})
+
+    def test_channel_header_without_message_does_not_claim_next_call(self):
+        filler = "x" * 100_000
+        content = (
+            f"<|channel|>commentary to=functions.get_story_metadata {filler}"
+            "<|channel|>commentary to=functions.get_chapter_summary"
+            '<|message|>{"chap_id": 2}<|end|>'
+        )
+        calls = _parse_tool_calls_from_content(content)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]["function"]["name"], "get_chapter_summary")
+        self.assertEqual(json.loads(calls[0]["function"]["arguments"]), {"chap_id": 2})
+
+    def test_strip_tool_call_tags_keeps_unclosed_markup_and_strips_long_blocks(self):
+        unclosed = "<tool_call>{" * 2000 + " trailing prose"
+        self.assertEqual(strip_tool_call_tags(unclosed), unclosed.strip())
+
+        body = "<tag> " * 20_000
+        content = f"Intro <tool_call>{body}</tool_call> Outro"
+        self.assertEqual(strip_tool_call_tags(content), "Intro  Outro")
+        self.assertEqual(
+            extract_thinking_from_content(f"<think>{body}</think>"), body.strip()
+        )
+
+    def test_calls_without_arguments_get_empty_json_object(self):
+        content = (
+            "<tool_call>get_project_overview</tool_call> "
+            '<tool_call>{"name": "get_story_metadata"}</tool_call> '
+            "<tool_call><function=list_chapters></function></tool_call> "
+            "<|tool_call>call:search_sourcebook{}<tool_call|> "
+            "[TOOL_CALL]get_chapter_summary[/TOOL_CALL]"
+        )
+        calls = _parse_tool_calls_from_content(content)
+        self.assertEqual(len(calls), 5)
+        for call in calls:
+            self.assertEqual(call["function"]["arguments"], "{}")
+
 
 if __name__ == "__main__":
     unittest.main()
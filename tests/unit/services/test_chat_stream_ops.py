@@ -7,7 +7,9 @@
 
 """Unit tests for chat stream injection logic."""
 
+import json
 from unittest import TestCase
+
 from augmentedquill.services.chat.chat_api_stream_ops import inject_chat_user_context
 
 
@@ -354,8 +356,6 @@ class TestChatStreamOps(TestCase):
         but the application state has since changed, we update the existing tool content
         instead of leaving it stale or prepending a new one (which would be redundant).
         """
-        import json
-
         # State: In Chapter 5
         payload = {"current_chapter": {"id": 5, "title": "Chap 5"}}
         # Note: the real tool uses chapter_id and chapter_title
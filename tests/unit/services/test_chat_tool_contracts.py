@@ -13,14 +13,11 @@ import os
 import tempfile
 import uuid
 from pathlib import Path
-from unittest import TestCase
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
-
-import augmentedquill.main as main
 from augmentedquill.services.chat.chat_tools_schema import get_story_tools
 from augmentedquill.services.chat.chat_tool_decorator import get_registered_tool_schemas
+from augmentedquill.services.llm import llm_http_ops
 from augmentedquill.services.projects.project_snapshots import capture_project_snapshot
 from augmentedquill.services.projects.projects import (
     get_active_project_dir,
@@ -29,6 +26,7 @@ from augmentedquill.services.projects.projects import (
 from augmentedquill.services.sourcebook.sourcebook_helpers import (
     sourcebook_create_entry,
 )
+from tests.unit.api.v1.api_test_case import ClientTestCase
 
 
 def _parse_tool_sse_result(text: str) -> dict:
@@ -44,7 +42,7 @@ def _parse_tool_sse_result(text: str) -> dict:
     return {}
 
 
-class ChatToolContractsTest(TestCase):
+class ChatToolContractsTest(ClientTestCase):
     _SPECIAL_CASE_MUTATION_TOOLS = {
         # Covered with nested-tool-call behavior assertions in test_chat_tools.py
         "call_editing_assistant",
@@ -84,6 +82,14 @@ class ChatToolContractsTest(TestCase):
         "write_book_content",
     }
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # get_story_tools() deep-copies every registered schema per call and the
+        # tests below only read them, so build the list once for the class.
+        cls._story_tools = get_story_tools()
+        cls._story_tool_names = [t["function"]["name"] for t in cls._story_tools]
+
     def setUp(self):
         self.td = tempfile.TemporaryDirectory()
         self.addCleanup(self.td.cleanup)
@@ -95,12 +101,14 @@ class ChatToolContractsTest(TestCase):
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
 
-        self.client = TestClient(main.app)
-        self._bootstrap_project()
+        # Tools that reach an LLM (editing assistant, summaries, keyword
+        # generation) hit the unreachable test endpoint; keep the retries but
+        # drop their 1s/2s/4s back-off so each failed call returns at once.
+        backoff_patch = patch.object(llm_http_ops, "_RETRY_BACKOFF_BASE_S", 0.0)
+        backoff_patch.start()
+        self.addCleanup(backoff_patch.stop)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
+        self._bootstrap_project()
 
     def _bootstrap_project(self):
         ok, msg = select_project("tool_contracts")
@@ -160,9 +168,6 @@ class ChatToolContractsTest(TestCase):
             synonyms=["The Hero"],
         )
 
-    def _tool_names(self):
-        return [t["function"]["name"] for t in get_story_tools()]
-
     def _call_tool(self, name: str, args, model_type: str = "CHAT"):
         if isinstance(args, str):
             arguments = args
@@ -492,65 +497,69 @@ class ChatToolContractsTest(TestCase):
         )
 
     def test_all_tools_handle_malformed_arguments_gracefully(self):
-        for name in self._tool_names():
-            content = self._call_tool(
-                name,
-                "{this is not valid json",
-                model_type=self._tool_role_for_execution(name),
-            )
-            self.assertIsInstance(
-                content, (dict, list, str, int, float, bool, type(None))
-            )
+        for name in self._story_tool_names:
+            with self.subTest(tool=name):
+                content = self._call_tool(
+                    name,
+                    "{this is not valid json",
+                    model_type=self._tool_role_for_execution(name),
+                )
+                self.assertIsInstance(
+                    content, (dict, list, str, int, float, bool, type(None))
+                )
 
     def test_all_tools_handle_invalid_content_gracefully(self):
-        for tool_schema in get_story_tools():
-            args = self._build_args_for_schema(tool_schema, invalid=True)
+        for tool_schema in self._story_tools:
             tool_name = tool_schema["function"]["name"]
-            content = self._call_tool(
-                tool_name,
-                args,
-                model_type=self._tool_role_for_execution(tool_name),
-            )
-            # Contract: invalid semantic input must never crash tool execution.
-            self.assertIsInstance(
-                content, (dict, list, str, int, float, bool, type(None))
-            )
+            with self.subTest(tool=tool_name):
+                args = self._build_args_for_schema(tool_schema, invalid=True)
+                content = self._call_tool(
+                    tool_name,
+                    args,
+                    model_type=self._tool_role_for_execution(tool_name),
+                )
+                # Contract: invalid semantic input must never crash tool execution.
+                self.assertIsInstance(
+                    content, (dict, list, str, int, float, bool, type(None))
+                )
 
     def test_all_tools_reject_unknown_argument_keys(self):
-        for tool_schema in get_story_tools():
+        for tool_schema in self._story_tools:
             tool_name = tool_schema["function"]["name"]
-            args = self._build_args_for_schema(tool_schema, invalid=False)
-            args["unexpected_key"] = "unexpected_value"
-            content = self._call_tool(
-                tool_name,
-                args,
-                model_type=self._tool_role_for_execution(tool_name),
-            )
-            self._assert_invalid_parameters(tool_name, content)
+            with self.subTest(tool=tool_name):
+                args = self._build_args_for_schema(tool_schema, invalid=False)
+                args["unexpected_key"] = "unexpected_value"
+                content = self._call_tool(
+                    tool_name,
+                    args,
+                    model_type=self._tool_role_for_execution(tool_name),
+                )
+                self._assert_invalid_parameters(tool_name, content)
 
     def test_all_tools_reject_missing_required_keys(self):
-        for tool_schema in get_story_tools():
+        for tool_schema in self._story_tools:
             fn = tool_schema["function"]
             tool_name = fn["name"]
             required = (fn.get("parameters") or {}).get("required") or []
             if not required:
                 continue
 
-            args = self._build_args_for_schema(tool_schema, invalid=False)
-            missing_key = required[0]
-            self.assertIn(
-                missing_key,
-                args,
-                f"Test harness failed to build required key {missing_key} for {tool_name}",
-            )
-            args.pop(missing_key)
+            with self.subTest(tool=tool_name):
+                args = self._build_args_for_schema(tool_schema, invalid=False)
+                missing_key = required[0]
+                self.assertIn(
+                    missing_key,
+                    args,
+                    f"Test harness failed to build required key {missing_key} for {tool_name}",
+                )
+                args.pop(missing_key)
 
-            content = self._call_tool(
-                tool_name,
-                args,
-                model_type=self._tool_role_for_execution(tool_name),
-            )
-            self._assert_invalid_parameters(tool_name, content)
+                content = self._call_tool(
+                    tool_name,
+                    args,
+                    model_type=self._tool_role_for_execution(tool_name),
+                )
+                self._assert_invalid_parameters(tool_name, content)
 
     def test_get_project_overview_include_notes_contract(self):
         content = self._call_tool("get_project_overview", {"include_notes": True})
@@ -701,36 +710,36 @@ class ChatToolContractsTest(TestCase):
                 side_effect=fake_image_description,
             ),
         ):
-            for tool_schema in get_story_tools():
-                ok, msg = select_project("tool_contracts")
-                self.assertTrue(ok, msg)
-
+            for tool_schema in self._story_tools:
                 name = tool_schema["function"]["name"]
+                with self.subTest(tool=name):
+                    ok, msg = select_project("tool_contracts")
+                    self.assertTrue(ok, msg)
+
+                    if name in ("call_writing_llm", "call_editing_assistant"):
+                        self._call_tool(
+                            "update_story_metadata",
+                            {
+                                "conflicts": [
+                                    {
+                                        "id": "c1",
+                                        "description": "Auto conflict guard for test",
+                                        "resolution": "Auto resolution",
+                                    }
+                                ]
+                            },
+                            model_type="CHAT",
+                        )
 
-                if name in ("call_writing_llm", "call_editing_assistant"):
-                    self._call_tool(
-                        "update_story_metadata",
-                        {
-                            "conflicts": [
-                                {
-                                    "id": "c1",
-                                    "description": "Auto conflict guard for test",
-                                    "resolution": "Auto resolution",
-                                }
-                            ]
-                        },
-                        model_type="CHAT",
+                    args = self._build_args_for_schema(tool_schema, invalid=False)
+                    content = self._call_tool(
+                        name,
+                        args,
+                        model_type=self._tool_role_for_execution(name),
                     )
 
-                args = self._build_args_for_schema(tool_schema, invalid=False)
-                content = self._call_tool(
-                    name,
-                    args,
-                    model_type=self._tool_role_for_execution(name),
-                )
-
-                self.assertNotIn("Execution error", json.dumps(content))
-                self.assertNotIn("Invalid parameters", json.dumps(content))
+                    self.assertNotIn("Execution error", json.dumps(content))
+                    self.assertNotIn("Invalid parameters", json.dumps(content))
 
     def test_all_project_mutation_tools_emit_story_changed_and_batch(self):
         expected_mutation_tools = {
@@ -771,7 +780,7 @@ class ChatToolContractsTest(TestCase):
             "replace_in_project",
         }
 
-        tool_names = set(self._tool_names())
+        tool_names = set(self._story_tool_names)
         covered_tools = (
             expected_mutation_tools
             | self._READ_ONLY_TOOLS
@@ -11,13 +11,10 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from unittest import TestCase
 from unittest.mock import AsyncMock, patch
 
-from fastapi.testclient import TestClient
-
-import augmentedquill.main as main
 from augmentedquill.services.projects.projects import select_project
+from tests.unit.api.v1.api_test_case import ClientTestCase
 
 
 def _parse_tool_sse_result(text: str) -> dict:
@@ -66,7 +63,7 @@ class _CapturingStreamMock:
         return _KwargsHolder(self.last_kwargs)
 
 
-class ChatToolsTest(TestCase):
+class ChatToolsTest(ClientTestCase):
     def setUp(self):
         self.td = tempfile.TemporaryDirectory()
         self.addCleanup(self.td.cleanup)
@@ -75,11 +72,6 @@ class ChatToolsTest(TestCase):
         self.registry_path = Path(self.td.name) / "projects.json"
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
-        self.client = TestClient(main.app)
-
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
 
     def _bootstrap_project(self):
         ok, msg = select_project("demo")
@@ -7,6 +7,7 @@
 
 """Tests for EPUB export security."""
 
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -30,10 +31,6 @@ class EpubExportSecurityTest(TestCase):
 
         self.client = TestClient(app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_export_epub_path_traversal_protection(self):
         # Create a legitimate project
         create_project("valid_project", project_type="novel")
@@ -59,8 +56,6 @@ class EpubExportSecurityTest(TestCase):
 
         # Update story.json to include the chapter
         story_path = project_dir / "story.json"
-        import json
-
         story = json.loads(story_path.read_text(encoding="utf-8"))
         story["chapters"] = [{"filename": "0001.txt", "title": "Chapter 1"}]
         story_path.write_text(json.dumps(story), encoding="utf-8")
@@ -29,10 +29,6 @@ class HallucinationPreventionTest(TestCase):
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
         self.client = TestClient(app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _setup_series_project(self):
         pname = "hallu_series"
         ok, msg = select_project(pname)
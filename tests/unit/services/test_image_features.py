@@ -53,10 +53,6 @@ class ImageFeaturesTest(TestCase):
         self.app = create_app()
         self.client = TestClient(self.app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_image_helpers(self):
         """Test helpers for metadata and listing."""
         # Create a file
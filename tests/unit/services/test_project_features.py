@@ -14,6 +14,7 @@ import os
 import tempfile
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from augmentedquill.services.projects.projects import (
     create_project,
@@ -22,6 +23,7 @@ from augmentedquill.services.projects.projects import (
     get_active_project_dir,
 )
 from augmentedquill.core.config import load_story_config
+from augmentedquill.services.projects import projects_api_asset_ops as asset_ops
 from augmentedquill.services.projects.project_helpers import _project_overview
 from fastapi.testclient import TestClient
 from augmentedquill.main import app
@@ -41,10 +43,6 @@ class ProjectFeaturesTest(TestCase):
 
         self.client = TestClient(app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_project_language_is_recorded(self):
         # language provided during creation should be persisted in story.json
         create_project("lang_proj", project_type="novel", language="es")
@@ -353,6 +351,47 @@ class ProjectFeaturesTest(TestCase):
             "Exported Content",
         )
 
+    def test_api_export_reuses_archive_until_project_changes(self):
+        create_project("export_cached", project_type="novel")
+        select_project("export_cached")
+        active = get_active_project_dir()
+        chapter = active / "chapters" / "0001.txt"
+        chapter.parent.mkdir(exist_ok=True)
+        chapter.write_text("First draft", encoding="utf-8")
+
+        first = self.client.get(
+            "/api/v1/projects/export", params={"name": "export_cached"}
+        )
+        second = self.client.get(
+            "/api/v1/projects/export", params={"name": "export_cached"}
+        )
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.content, second.content)
+
+        chapter.write_text("Second draft, longer", encoding="utf-8")
+        third = self.client.get(
+            "/api/v1/projects/export", params={"name": "export_cached"}
+        )
+        with zipfile.ZipFile(io.BytesIO(third.content)) as zf:
+            self.assertEqual(
+                zf.read("chapters/0001.txt").decode("utf-8"), "Second draft, longer"
+            )
+
+    def test_export_skips_cache_for_archives_above_size_cap(self):
+        create_project("export_large", project_type="novel")
+        select_project("export_large")
+        active = get_active_project_dir()
+        chapter = active / "chapters" / "0001.txt"
+        chapter.parent.mkdir(exist_ok=True)
+        chapter.write_text("Some content", encoding="utf-8")
+
+        with patch.object(asset_ops, "_EXPORT_CACHE_MAX_BYTES", 1):
+            response = self.client.get(
+                "/api/v1/projects/export", params={"name": "export_large"}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(asset_ops._export_cache, {})
+
     def test_api_import_workflow(self):
         """Test the actual API endpoint for import."""
         # Setup source project
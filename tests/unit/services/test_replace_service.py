@@ -145,10 +145,6 @@ class TestReplaceAll(TestCase):
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _make_and_select_project(self, project_name: str = "replace_test") -> Path:
         from augmentedquill.services.projects.projects import (
             create_project,
@@ -475,10 +471,6 @@ class TestReplaceSingle(TestCase):
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _make_and_select_project(self, project_name: str = "single_test") -> Path:
         from augmentedquill.services.projects.projects import (
             create_project,
@@ -51,10 +51,6 @@ class ScratchpadTest(TestCase):
         self.assertTrue(ok, msg)
         self.project_dir = self.projects_root / "test_project"
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_scratchpad_cycle(self):
         """Test writing to and reading from the scratchpad via API."""
 
@@ -172,10 +172,6 @@ class TestRunSearch(TestCase):
         os.environ["AUGQ_PROJECTS_ROOT"] = str(self.projects_root)
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _make_and_select_project(self) -> Path:
         """Create a minimal novel project and select it as active."""
         from augmentedquill.services.projects.projects import (
@@ -110,6 +110,19 @@ class SettingsApiOpsTest(TestCase):
         assert err is not None
         self.assertIn("missing base_url", err)
 
+    def test_clean_machine_openai_cfg_for_put_rejects_duplicate_names(self):
+        payload, selected, err = clean_machine_openai_cfg_for_put(
+            {
+                "models": [
+                    {"name": "m1", "base_url": "x", "model": "a"},
+                    {"name": " m1 ", "base_url": "y", "model": "b"},
+                ]
+            }
+        )
+        self.assertIsNone(payload)
+        self.assertIsNone(selected)
+        self.assertEqual(err, "Duplicate model name not allowed: m1")
+
     def test_update_story_field_persists_value(self):
         with tempfile.TemporaryDirectory() as td:
             story_path = Path(td) / "story.json"
@@ -35,10 +35,6 @@ class SourcebookKeywordGenerationFlowTest(TestCase):
         ok, msg = select_project("test_kw_flow")
         self.assertTrue(ok, msg)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_keyword_generation_uses_writing_model_and_request_limits(self):
         payload = {"model_name": "unit-test"}
 
@@ -57,10 +57,6 @@ class SourcebookSearchRefinementTest(TestCase):
         sourcebook_create_entry("Alaric's Sword", "A sharp blade.", "Item")
         sourcebook_create_entry("Rose Castle", "Where Alaric lives.", "Location")
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _call_search_in_project(self, query: str, scope: str = "sourcebook"):
         body = {
             "model_type": "CHAT",
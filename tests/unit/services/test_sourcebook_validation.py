@@ -47,10 +47,6 @@ class SourcebookValidationTest(TestCase):
         # Select it (creates registry entry)
         select_project("test_proj")
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def test_create_invalid_entry_returns_error(self):
         # Category is now mandatory, so we must provide it to test other fields
         result = sourcebook_create_entry(
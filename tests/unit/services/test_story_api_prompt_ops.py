@@ -7,9 +7,15 @@
 
 """Tests for the prompt building helpers used by story generation."""
 
+import json
+import os
+import tempfile
+from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 from augmentedquill.core.prompts import get_system_message
+from augmentedquill.services.story import story_api_prompt_ops
 from augmentedquill.services.story.story_api_prompt_ops import (
     _get_read_only_tool_schemas,
     build_ai_action_messages,
@@ -22,6 +28,103 @@ from augmentedquill.services.story.story_generation_common import (
 
 
 class StoryApiPromptOpsTest(TestCase):
+    def test_resolve_model_runtime_reuses_unchanged_machine_config(self):
+        with (
+            patch.dict(story_api_prompt_ops._machine_config_cache, clear=True),
+            tempfile.TemporaryDirectory() as td,
+        ):
+            machine_path = Path(td) / "config" / "machine.json"
+            machine_path.parent.mkdir()
+
+            def write_override(text: str) -> None:
+                machine_path.write_text(
+                    json.dumps(
+                        {
+                            "openai": {
+                                "models": [
+                                    {
+                                        "name": "m1",
+                                        "prompt_overrides": {"story_writer": text},
+                                    }
+                                ]
+                            }
+                        }
+                    ),
+                    encoding="utf-8",
+                )
+
+            write_override("First")
+            credentials = ("http://x", None, "model", 60, "m1")
+            with (
+                patch.object(
+                    story_api_prompt_ops.llm,
+                    "resolve_openai_credentials",
+                    return_value=credentials,
+                ),
+                patch.object(
+                    story_api_prompt_ops,
+                    "load_machine_config",
+                    wraps=story_api_prompt_ops.load_machine_config,
+                ) as load_spy,
+            ):
+                first = story_api_prompt_ops.resolve_model_runtime(
+                    {}, "WRITING", Path(td)
+                )
+                second = story_api_prompt_ops.resolve_model_runtime(
+                    {}, "WRITING", Path(td)
+                )
+                self.assertEqual(first[5], {"story_writer": "First"})
+                self.assertEqual(second[5], {"story_writer": "First"})
+                self.assertEqual(load_spy.call_count, 1)
+
+                write_override("Second, changed")
+                third = story_api_prompt_ops.resolve_model_runtime(
+                    {}, "WRITING", Path(td)
+                )
+                self.assertEqual(third[5], {"story_writer": "Second, changed"})
+                self.assertEqual(load_spy.call_count, 2)
+
+    def test_resolve_model_runtime_reloads_when_interpolated_env_changes(self):
+        with (
+            patch.dict(story_api_prompt_ops._machine_config_cache, clear=True),
+            tempfile.TemporaryDirectory() as td,
+        ):
+            machine_path = Path(td) / "config" / "machine.json"
+            machine_path.parent.mkdir()
+            machine_path.write_text(
+                json.dumps(
+                    {
+                        "openai": {
+                            "models": [
+                                {
+                                    "name": "m1",
+                                    "prompt_overrides": {
+                                        "story_writer": "${AUGQ_TEST_WRITER_PROMPT}"
+                                    },
+                                }
+                            ]
+                        }
+                    }
+                ),
+                encoding="utf-8",
+            )
+            credentials = ("http://x", None, "model", 60, "m1")
+            with patch.object(
+                story_api_prompt_ops.llm,
+                "resolve_openai_credentials",
+                return_value=credentials,
+            ):
+                os.environ["AUGQ_TEST_WRITER_PROMPT"] = "First"
+                first = story_api_prompt_ops.resolve_model_runtime(
+                    {}, "WRITING", Path(td)
+                )
+                os.environ["AUGQ_TEST_WRITER_PROMPT"] = "Second"
+                second = story_api_prompt_ops.resolve_model_runtime(
+                    {}, "WRITING", Path(td)
+                )
+            self.assertEqual(first[5], {"story_writer": "First"})
+            self.assertEqual(second[5], {"story_writer": "Second"})
+
     def test_build_ai_action_messages_system_prompt_has_no_placeholders(self):
         messages = build_ai_action_messages(
             target="summary",
@@ -100,6 +203,29 @@ class StoryApiPromptOpsTest(TestCase):
         self.assertNotIn("Existing draft text (do not change)", user_msg["content"])
         self.assertNotIn("# Chapter 1", user_msg["content"])
 
+    def test_ai_action_prompt_keys_cover_summary_and_chapter_actions(self):
+        keys = story_api_prompt_ops._ai_action_prompt_keys
+        self.assertEqual(
+            keys("summary", "update", "novel"),
+            ("ai_action_summary_update", "chapter_summary_update"),
+        )
+        self.assertEqual(
+            keys("story_summary", "rewrite", "short-story"),
+            ("ai_action_summary_rewrite", "chapter_summary_new"),
+        )
+        self.assertEqual(
+            keys("story_summary", "write", "series"),
+            ("ai_action_summary_rewrite", "story_summary_new"),
+        )
+        self.assertEqual(
+            keys("chapter", "rewrite", "novel"),
+            ("ai_action_chapter_extend", "chapter_ai_prefill_task"),
+        )
+        self.assertEqual(
+            keys("chapter", "write", "novel"),
+            ("ai_action_chapter_write", "ai_action_chapter_write_user"),
+        )
+
     def test_read_only_tool_schema_filter_excludes_editing_functions(self):
         tools = _get_read_only_tool_schemas(project_type="series")
         names = {t["function"]["name"] for t in tools}
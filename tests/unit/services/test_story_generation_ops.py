@@ -7,6 +7,8 @@
 
 """Defines the test story generation ops unit so this responsibility stays isolated, testable, and easy to evolve."""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch
 
@@ -18,6 +20,7 @@ from augmentedquill.services.projects.projects import (
 from augmentedquill.api.v1.story_routes.generation_streaming import (
     _create_gen_source,
 )
+from augmentedquill.services.story import story_api_stream_ops
 from augmentedquill.services.story.story_api_stream_ops import (
     stream_unified_chat_content,
 )
@@ -99,6 +102,124 @@ async def test_stream_unified_chat_content_multi_round():
         assert args[1] == {"title": "New Title"}
 
 
+@pytest.mark.anyio
+async def test_stream_unified_chat_content_coalesces_text_fragments(monkeypatch):
+    monkeypatch.setattr(story_api_stream_ops, "STREAM_COALESCE_WINDOW_S", 60.0)
+    monkeypatch.setattr(story_api_stream_ops, "STREAM_COALESCE_MAX_CHARS", 6)
+
+    async def fake_stream(*args, **kwargs):
+        for chunk in (
+            {"content": "A"},
+            {"content": "bc"},
+            {"content": "de"},
+            {"content": "fgh"},
+            {"thinking": "hmm"},
+            {"content": "ij"},
+            {"done": True},
+            {"content": "k"},
+        ):
+            yield chunk
+
+    with patch(
+        "augmentedquill.services.llm.llm.unified_chat_stream",
+        side_effect=fake_stream,
+    ):
+        results = [
+            chunk
+            async for chunk in stream_unified_chat_content(
+                messages=[{"role": "user", "content": "Go"}],
+                base_url="http://fake",
+                api_key="key",
+                model_id="model",
+                timeout_s=60,
+            )
+        ]
+
+    assert results == [
+        {"content": "A"},
+        {"content": "bcdefgh"},
+        {"thinking": "hmm"},
+        {"content": "ij"},
+        {"done": True},
+        {"content": "k"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_stream_unified_chat_content_flushes_held_text_when_upstream_stalls(
+    monkeypatch,
+):
+    monkeypatch.setattr(story_api_stream_ops, "STREAM_COALESCE_WINDOW_S", 0.05)
+    monkeypatch.setattr(story_api_stream_ops, "STREAM_COALESCE_MAX_CHARS", 1000)
+
+    async def fake_stream(*args, **kwargs):
+        yield {"content": "Hello"}
+        yield {"content": " world"}
+        await asyncio.sleep(1.0)
+        yield {"content": "!"}
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    arrivals = []
+    with patch(
+        "augmentedquill.services.llm.llm.unified_chat_stream",
+        side_effect=fake_stream,
+    ):
+        async for chunk in stream_unified_chat_content(
+            messages=[{"role": "user", "content": "Go"}],
+            base_url="http://fake",
+            api_key="key",
+            model_id="model",
+            timeout_s=60,
+        ):
+            arrivals.append((chunk, loop.time() - started))
+
+    assert [chunk for chunk, _ in arrivals] == [
+        {"content": "Hello"},
+        {"content": " world"},
+        {"content": "!"},
+    ]
+    # " world" is held for at most the window, not until the stall ends.
+    assert arrivals[1][1] < 0.5
+
+
+@pytest.mark.anyio
+async def test_stream_unified_chat_content_reads_upstream_inline_without_held_text():
+    upstream_tasks = []
+
+    async def fake_stream(*args, **kwargs):
+        for idx in range(3):
+            upstream_tasks.append(asyncio.current_task())
+            yield {"tool_calls": [{"index": idx, "function": {"name": "t"}}]}
+        upstream_tasks.append(asyncio.current_task())
+
+    with (
+        patch(
+            "augmentedquill.services.llm.llm.unified_chat_stream",
+            side_effect=fake_stream,
+        ),
+        patch(
+            "augmentedquill.services.story.story_api_stream_ops.execute_registered_tool",
+            return_value={"role": "tool", "content": "ok"},
+        ),
+    ):
+        results = [
+            chunk
+            async for chunk in stream_unified_chat_content(
+                messages=[{"role": "user", "content": "Go"}],
+                base_url="http://fake",
+                api_key="key",
+                model_id="model",
+                timeout_s=60,
+                max_rounds=1,
+            )
+        ]
+
+    assert len(results) == 3
+    # No text is held back, so no helper task is spawned per upstream chunk.
+    assert set(upstream_tasks) == {asyncio.current_task()}
+
+
 @pytest.mark.anyio
 async def test_prepare_ai_action_summary_rewrite_blanks_original_summary_for_tool_calls():
     ok, msg = select_project("rewrite_summary_action")
@@ -307,3 +428,51 @@ def test_prepare_ai_action_chapter_extend_prefills_full_draft_with_heading():
             "enable_thinking": False,
         }
     }
+
+
+def test_ensure_chapter_slot_creates_independent_slots():
+    from augmentedquill.services.story.story_api_state_ops import (
+        ensure_chapter_slot,
+    )
+
+    chapters = [{"title": "One", "summary": "s"}]
+    ensure_chapter_slot(chapters, 3)
+    assert len(chapters) == 4
+    chapters[2]["summary"] = "only here"
+    assert [c["summary"] for c in chapters] == ["s", "", "only here", ""]
+    ensure_chapter_slot(chapters, 1)
+    assert len(chapters) == 4
+
+
+def test_collect_chapter_summaries_skips_empty_and_defaults_titles():
+    from augmentedquill.services.story.story_api_state_ops import (
+        collect_chapter_summaries,
+        get_normalized_chapters,
+    )
+
+    chapters = get_normalized_chapters(
+        {
+            "chapters": [
+                {"title": "Opening", "summary": "  "},
+                {"title": "", "summary": " Middle part "},
+                {"title": " Finale ", "summary": "End"},
+            ]
+        }
+    )
+    assert collect_chapter_summaries(chapters) == [
+        "Chapter 2:\nMiddle part",
+        "Finale:\nEnd",
+    ]
+
+
+def test_read_text_or_raise_wraps_io_and_decode_errors(tmp_path):
+    from augmentedquill.services.exceptions import PersistenceError
+    from augmentedquill.services.story.story_api_state_ops import read_text_or_raise
+
+    with pytest.raises(PersistenceError, match="Failed to read chapter"):
+        read_text_or_raise(tmp_path / "missing.txt")
+
+    bad = tmp_path / "bad.txt"
+    bad.write_bytes(b"\xff\xfe\xfa")
+    with pytest.raises(PersistenceError):
+        read_text_or_raise(bad)
@@ -7,6 +7,7 @@
 
 """Defines the test streaming story unit so this responsibility stays isolated, testable, and easy to evolve."""
 
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -30,10 +31,6 @@ class StreamingStoryTest(TestCase):
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
         self.client = TestClient(main.app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _make_project(self, name: str = "novel") -> Path:
         ok, msg = select_project(name)
         self.assertTrue(ok, msg)
@@ -80,8 +77,6 @@ class StreamingStoryTest(TestCase):
         self.assertEqual(r.status_code, 200, r.text)
         self.assertEqual(r.text, "ABC")
         # Persisted
-        import json
-
         story = json.loads((pdir / "story.json").read_text(encoding="utf-8"))
         self.assertEqual(story["chapters"][0]["summary"], "ABC")
 
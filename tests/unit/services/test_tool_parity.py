@@ -94,10 +94,6 @@ class ToolParityTest(TestCase):
         )
         self.assertEqual(r.status_code, 200)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _call_tool(self, name, args, model_type: str = "CHAT"):
         body = {
             "model_name": "gpt-4o",
@@ -348,6 +344,7 @@ class ToolParityTest(TestCase):
             60,
             "dummy-model",
             {},
+            "EDITING",
         )
         # We patch both unified_chat_complete and openai credential resolution so the
         # tool doesn't attempt to read real machine.json or make network calls.
@@ -361,7 +358,7 @@ class ToolParityTest(TestCase):
                 return_value=_dummy_runtime[:5],
             ),
             patch(
-                "augmentedquill.services.story.story_generation_ops.resolve_model_runtime",
+                "augmentedquill.services.story.story_generation_common.resolve_model_runtime",
                 return_value=_dummy_runtime,
             ),
         ):
@@ -387,6 +384,7 @@ class ToolParityTest(TestCase):
             60,
             "dummy-model",
             {},
+            "EDITING",
         )
         first_response = {
             "content": "",
@@ -418,7 +416,7 @@ class ToolParityTest(TestCase):
                 return_value=_dummy_runtime[:5],
             ),
             patch(
-                "augmentedquill.services.story.story_generation_ops.resolve_model_runtime",
+                "augmentedquill.services.story.story_generation_common.resolve_model_runtime",
                 return_value=_dummy_runtime,
             ),
             patch(
@@ -449,6 +447,7 @@ class ToolParityTest(TestCase):
             60,
             "dummy-model",
             {},
+            "EDITING",
         )
         with (
             patch(
@@ -460,7 +459,7 @@ class ToolParityTest(TestCase):
                 return_value=_dummy_runtime[:5],
             ),
             patch(
-                "augmentedquill.services.story.story_generation_ops.resolve_model_runtime",
+                "augmentedquill.services.story.story_generation_common.resolve_model_runtime",
                 return_value=_dummy_runtime,
             ),
         ):
@@ -915,9 +914,7 @@ class ToolParityTest(TestCase):
         self.assertTrue(res.get("ok"))
 
         # story.json should now have 0 chapters in the book
-        import json as _json
-
         pdir = self.projects_root / self.project_name
-        story = _json.loads((pdir / "story.json").read_text())
+        story = json.loads((pdir / "story.json").read_text())
         book = next(b for b in story["books"] if b["id"] == self.book_id)
         self.assertEqual(len(book.get("chapters", [])), 0)
@@ -42,10 +42,6 @@ class TestChatToolsSymmetry(TestCase):
         os.environ["AUGQ_PROJECTS_REGISTRY"] = str(self.registry_path)
         self.client = TestClient(main.app)
 
-    def tearDown(self):
-        os.environ.pop("AUGQ_PROJECTS_ROOT", None)
-        os.environ.pop("AUGQ_PROJECTS_REGISTRY", None)
-
     def _bootstrap_project(self):
         ok, msg = select_project("test_symmetry")
         self.assertTrue(ok, msg)